@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import Depends
+
+
+def bind_dependency(service: object | None, fallback: Any) -> Any:
+    """Return the dependency a router factory should use for an optional service.
+
+    Router factories accept their services as optional arguments. A service
+    passed at build time is bound once here, so requests skip the ``app.state``
+    lookup. When it is left out, ``fallback`` is returned unchanged and the
+    service is resolved from ``app.state`` per request.
+    """
+
+    if service is None:
+        return fallback
+    bound_service = service
+
+    def _bound_service() -> object:
+        return bound_service
+
+    return Depends(_bound_service)
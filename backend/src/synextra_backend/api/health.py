@@ -1,6 +1,7 @@
 from typing import Final, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, ConfigDict
 
 STATUS_OK: Final[Literal["ok"]] = "ok"
@@ -14,10 +15,18 @@ class HealthResponse(BaseModel):
 
 
 def build_health_router(*, service_name: str) -> APIRouter:
-    router = APIRouter(tags=["system"])
-
-    @router.get("/health", response_model=HealthResponse, summary="Health check")
-    async def health() -> HealthResponse:
-        return HealthResponse(status=STATUS_OK, service=service_name)
+    router = APIRouter(tags=["system"], default_response_class=ORJSONResponse)
+
+    # The payload never changes for a given service, so serialize it once.
+    payload = HealthResponse(status=STATUS_OK, service=service_name).model_dump_json().encode()
+
+    @router.get(
+        "/health",
+        response_model=None,
+        responses={200: {"model": HealthResponse}},
+        summary="Health check",
+    )
+    async def health() -> Response:
+        return Response(content=payload, media_type="application/json")
 
     return router
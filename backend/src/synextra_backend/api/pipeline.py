@@ -1,26 +1,33 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import AsyncIterator
-from typing import cast
-from uuid import uuid4
+from secrets import token_hex
+from typing import BinaryIO, cast
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from starlette.datastructures import UploadFile
 from synextra.schemas.pipeline import (
     PipelineAgentOutputEnvelope,
     PipelineAgentRunRequest,
     PipelineBm25SearchRequest,
+    PipelineEvidenceChunk,
     PipelineEvidenceResponse,
     PipelineParallelSearchRequest,
     PipelineReadDocumentRequest,
+    PipelineRunEvent,
     PipelineRunSpec,
 )
 from synextra.services.pipeline_runtime import PipelineRuntime
 
-from synextra_backend.schemas.errors import ApiErrorResponse, error_response
+from synextra_backend.api.dependencies import bind_dependency
+from synextra_backend.schemas.errors import (
+    ApiErrorResponse,
+    error_json_response,
+    error_response,
+)
 
 
 def _get_pipeline_runtime(request: Request) -> PipelineRuntime:
@@ -31,71 +38,103 @@ def _get_pipeline_runtime(request: Request) -> PipelineRuntime:
 
 
 PIPELINE_RUNTIME_DEP = Depends(_get_pipeline_runtime)
+_RUN_SHARD_COUNT = 16
+_JSON_MEDIA_TYPE = "application/json"
+
+# Serializers are built once at import so per-response encoding goes straight to
+# pydantic-core without re-resolving the model schema.
+_RUN_EVENT_ADAPTER: TypeAdapter[PipelineRunEvent] = TypeAdapter(PipelineRunEvent)
+_EVIDENCE_RESPONSE_ADAPTER = TypeAdapter(PipelineEvidenceResponse)
+_AGENT_OUTPUT_ADAPTER = TypeAdapter(PipelineAgentOutputEnvelope)
+
+
+def _evidence_response(evidence: list[PipelineEvidenceChunk]) -> Response:
+    # Evidence comes straight from the runtime, so skip FastAPI's response_model
+    # revalidation and serialize the trusted payload directly.
+    payload = PipelineEvidenceResponse.model_construct(evidence=evidence)
+    return Response(
+        content=_EVIDENCE_RESPONSE_ADAPTER.dump_json(payload), media_type=_JSON_MEDIA_TYPE
+    )
 
 
-def build_pipeline_router() -> APIRouter:
-    router = APIRouter(prefix="/v1/pipeline", tags=["pipeline"])
-    active_runs: dict[str, asyncio.Event] = {}
+def build_pipeline_router(*, pipeline_runtime: PipelineRuntime | None = None) -> APIRouter:
+    runtime_dep = bind_dependency(pipeline_runtime, PIPELINE_RUNTIME_DEP)
+    router = APIRouter(
+        prefix="/v1/pipeline", tags=["pipeline"], default_response_class=ORJSONResponse
+    )
+    # Pause handles for in-flight runs, sharded by run id so bursts of run
+    # starts grow several small dicts instead of resizing one large one.
+    active_run_shards: list[dict[str, asyncio.Event]] = [{} for _ in range(_RUN_SHARD_COUNT)]
+
+    def _active_runs(run_id: str) -> dict[str, asyncio.Event]:
+        return active_run_shards[hash(run_id) & (_RUN_SHARD_COUNT - 1)]
 
     @router.post(
         "/tools/bm25-search",
-        response_model=PipelineEvidenceResponse,
+        response_model=None,
         status_code=200,
+        responses={200: {"model": PipelineEvidenceResponse}},
         summary="Run BM25 search tool",
     )
     async def bm25_search(
         body: PipelineBm25SearchRequest,
-        runtime: PipelineRuntime = PIPELINE_RUNTIME_DEP,
-    ) -> PipelineEvidenceResponse:
+        runtime: PipelineRuntime = runtime_dep,
+    ) -> Response:
         evidence = runtime.bm25_search(
             query=body.query,
             top_k=body.top_k,
             document_ids=body.document_ids,
         )
-        return PipelineEvidenceResponse(evidence=evidence)
+        return _evidence_response(evidence)
 
     @router.post(
         "/tools/read-document",
-        response_model=PipelineEvidenceResponse,
+        response_model=None,
         status_code=200,
+        responses={200: {"model": PipelineEvidenceResponse}},
         summary="Run read_document tool",
     )
     async def read_document(
         body: PipelineReadDocumentRequest,
-        runtime: PipelineRuntime = PIPELINE_RUNTIME_DEP,
-    ) -> PipelineEvidenceResponse:
+        runtime: PipelineRuntime = runtime_dep,
+    ) -> Response:
         evidence = runtime.read_document(
             page=body.page,
             start_line=body.start_line,
             end_line=body.end_line,
             document_id=body.document_id,
         )
-        return PipelineEvidenceResponse(evidence=evidence)
+        return _evidence_response(evidence)
 
     @router.post(
         "/tools/parallel-search",
-        response_model=PipelineEvidenceResponse,
+        response_model=None,
         status_code=200,
+        responses={200: {"model": PipelineEvidenceResponse}},
         summary="Run parallel_search tool",
     )
     async def parallel_search(
         body: PipelineParallelSearchRequest,
-        runtime: PipelineRuntime = PIPELINE_RUNTIME_DEP,
-    ) -> PipelineEvidenceResponse:
+        runtime: PipelineRuntime = runtime_dep,
+    ) -> Response:
         evidence = await runtime.parallel_search(body)
-        return PipelineEvidenceResponse(evidence=evidence)
+        return _evidence_response(evidence)
 
     @router.post(
         "/agents/run",
-        response_model=PipelineAgentOutputEnvelope,
+        response_model=None,
         status_code=200,
+        responses={200: {"model": PipelineAgentOutputEnvelope}},
         summary="Run an agent step using upstream evidence and agent outputs",
     )
     async def run_agent(
         body: PipelineAgentRunRequest,
-        runtime: PipelineRuntime = PIPELINE_RUNTIME_DEP,
-    ) -> PipelineAgentOutputEnvelope:
-        return runtime.run_agent(body)
+        runtime: PipelineRuntime = runtime_dep,
+    ) -> Response:
+        return Response(
+            content=_AGENT_OUTPUT_ADAPTER.dump_json(runtime.run_agent(body)),
+            media_type=_JSON_MEDIA_TYPE,
+        )
 
     @router.post(
         "/runs/stream",
@@ -106,8 +145,8 @@ def build_pipeline_router() -> APIRouter:
     )
     async def run_stream(
         request: Request,
-        runtime: PipelineRuntime = PIPELINE_RUNTIME_DEP,
-    ) -> StreamingResponse | JSONResponse:
+        runtime: PipelineRuntime = runtime_dep,
+    ) -> Response:
         form = await request.form()
         spec_value = form.get("spec")
         if not isinstance(spec_value, str):
@@ -116,39 +155,37 @@ def build_pipeline_router() -> APIRouter:
                 message="Form field 'spec' must contain JSON",
                 recoverable=True,
             )
-            return JSONResponse(status_code=400, content=error_payload.model_dump())
+            return error_json_response(400, error_payload)
 
         try:
-            spec_data = json.loads(spec_value)
-            spec = PipelineRunSpec.model_validate(spec_data)
+            spec = PipelineRunSpec.model_validate_json(spec_value.encode())
         except Exception as exc:
             error_payload = error_response(
                 code="pipeline_spec_invalid",
                 message=f"Invalid pipeline spec: {exc}",
                 recoverable=True,
             )
-            return JSONResponse(status_code=400, content=error_payload.model_dump())
+            return error_json_response(400, error_payload)
 
-        files_by_node: dict[str, tuple[str, str | None, bytes]] = {}
-        for key, value in form.multi_items():
-            if not key.startswith("file:"):
-                continue
+        # Uploads are already spooled by the multipart parser; hand the spooled
+        # file to the runtime instead of copying it into memory here.
+        files_by_node: dict[str, tuple[str, str | None, BinaryIO]] = {}
+        for node_id in spec.file_node_ids():
+            value = form.get(f"file:{node_id}")
             if not isinstance(value, UploadFile):
                 continue
-            node_id = key.removeprefix("file:")
-            file_bytes = await value.read()
             files_by_node[node_id] = (
                 value.filename or "upload",
                 value.content_type,
-                file_bytes,
+                value.file,
             )
 
-        run_id = uuid4().hex
+        run_id = token_hex(16)
         pause_event = asyncio.Event()
         pause_event.set()
-        active_runs[run_id] = pause_event
+        _active_runs(run_id)[run_id] = pause_event
 
-        async def stream_events() -> AsyncIterator[str]:
+        async def stream_events() -> AsyncIterator[bytes]:
             try:
                 async for event in runtime.run_stream(
                     spec=spec,
@@ -156,9 +193,10 @@ def build_pipeline_router() -> APIRouter:
                     run_id=run_id,
                     pause_event=pause_event,
                 ):
-                    yield event.model_dump_json() + "\n"
+                    yield _RUN_EVENT_ADAPTER.dump_json(event) + b"\n"
             finally:
-                active_runs.pop(run_id, None)
+                _active_runs(run_id).pop(run_id, None)
+                await form.close()
 
         return StreamingResponse(
             stream_events(),
@@ -176,17 +214,17 @@ def build_pipeline_router() -> APIRouter:
         responses={404: {"model": ApiErrorResponse}},
         summary="Pause a running pipeline between nodes",
     )
-    async def pause_run(run_id: str) -> JSONResponse:
-        event = active_runs.get(run_id)
+    async def pause_run(run_id: str) -> Response:
+        event = _active_runs(run_id).get(run_id)
         if event is None:
             payload = error_response(
                 code="run_not_found",
                 message=f"No active run with id {run_id}",
                 recoverable=False,
             )
-            return JSONResponse(status_code=404, content=payload.model_dump())
+            return error_json_response(404, payload)
         event.clear()
-        return JSONResponse(status_code=200, content={"status": "paused", "run_id": run_id})
+        return ORJSONResponse(status_code=200, content={"status": "paused", "run_id": run_id})
 
     @router.post(
         "/runs/{run_id}/resume",
@@ -195,16 +233,16 @@ def build_pipeline_router() -> APIRouter:
         responses={404: {"model": ApiErrorResponse}},
         summary="Resume a paused pipeline run",
     )
-    async def resume_run(run_id: str) -> JSONResponse:
-        event = active_runs.get(run_id)
+    async def resume_run(run_id: str) -> Response:
+        event = _active_runs(run_id).get(run_id)
         if event is None:
             payload = error_response(
                 code="run_not_found",
                 message=f"No active run with id {run_id}",
                 recoverable=False,
             )
-            return JSONResponse(status_code=404, content=payload.model_dump())
+            return error_json_response(404, payload)
         event.set()
-        return JSONResponse(status_code=200, content={"status": "resumed", "run_id": run_id})
+        return ORJSONResponse(status_code=200, content={"status": "resumed", "run_id": run_id})
 
     return router
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
+import math
+import time
 from collections.abc import AsyncIterator
 from contextlib import suppress
 from typing import Any, cast
 
+import anyio
+import orjson
 from fastapi import APIRouter, Depends, Request, Response
-from fastapi.responses import JSONResponse, StreamingResponse
-from synextra.schemas.rag_chat import RagChatRequest, RagChatResponse, RetrievalMode, StreamEvent
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from synextra.schemas.rag_chat import (
+    RagChatRequest,
+    RagChatResponse,
+    RagCitation,
+    RetrievalMode,
+    StreamEvent,
+)
 from synextra.services.rag_agent_orchestrator import RagAgentOrchestrator
 
-from synextra_backend.schemas.errors import ApiErrorResponse, error_response
+from synextra_backend.api.dependencies import bind_dependency
+from synextra_backend.schemas.errors import (
+    ApiErrorResponse,
+    error_json_response,
+    error_response,
+)
 
 _STREAM_METADATA_SEPARATOR = "\x1e"
 _STREAM_EVENTS_SEPARATOR = "\x1d"
-_STREAM_EVENTS_DONE = object()
-_NO_PRELOADED_EVENT = object()
+_STREAM_METADATA_SEPARATOR_BYTES = _STREAM_METADATA_SEPARATOR.encode()
+_STREAM_EVENTS_SEPARATOR_BYTES = _STREAM_EVENTS_SEPARATOR.encode()
+_STREAM_EVENT_ADAPTER: TypeAdapter[StreamEvent] = TypeAdapter(StreamEvent)
+_CITATIONS_ADAPTER = TypeAdapter(list[RagCitation])
 _RETRIEVAL_ERROR_ANSWER = "I hit an internal error while gathering evidence. Please retry."
 _HYBRID_MODE: RetrievalMode = "hybrid"
+_TOKEN_FLUSH_BYTES = 8192
+_TOKEN_FLUSH_INTERVAL_SECONDS = 0.025
+
+logger = logging.getLogger(__name__)
 
 
 def _get_orchestrator(request: Request) -> RagAgentOrchestrator:
@@ -31,8 +53,27 @@ def _get_orchestrator(request: Request) -> RagAgentOrchestrator:
 ORCHESTRATOR_DEPENDENCY = Depends(_get_orchestrator)
 
 
-def build_rag_chat_router() -> APIRouter:
-    router = APIRouter(prefix="/v1/rag", tags=["rag"])
+def _encode_event_line(event: StreamEvent) -> bytes:
+    return _STREAM_EVENT_ADAPTER.dump_json(event) + b"\n"
+
+
+def _encode_metadata_trailer(metadata: dict[str, Any]) -> bytes:
+    return _STREAM_METADATA_SEPARATOR_BYTES + orjson.dumps(metadata, default=str)
+
+
+# Everything streamed after the events when retrieval fails is constant.
+_RETRIEVAL_ERROR_STREAM_TAIL = (
+    _STREAM_EVENTS_SEPARATOR_BYTES
+    + _RETRIEVAL_ERROR_ANSWER.encode()
+    + _encode_metadata_trailer(
+        {"citations": [], "mode": _HYBRID_MODE, "tools_used": ["chat_failed"]}
+    )
+)
+
+
+def build_rag_chat_router(*, rag_orchestrator: RagAgentOrchestrator | None = None) -> APIRouter:
+    orchestrator_dep = bind_dependency(rag_orchestrator, ORCHESTRATOR_DEPENDENCY)
+    router = APIRouter(prefix="/v1/rag", tags=["rag"], default_response_class=ORJSONResponse)
 
     @router.post(
         "/sessions/{session_id}/messages",
@@ -46,20 +87,23 @@ def build_rag_chat_router() -> APIRouter:
     async def post_message(
         session_id: str,
         request: RagChatRequest,
-        orchestrator: RagAgentOrchestrator = ORCHESTRATOR_DEPENDENCY,
-    ) -> RagChatResponse | JSONResponse:
+        orchestrator: RagAgentOrchestrator = orchestrator_dep,
+    ) -> RagChatResponse | Response:
         try:
             return await orchestrator.handle_message(
                 session_id=session_id,
                 request=request,
             )
-        except Exception as exc:  # pragma: no cover
+        except Exception as exc:
+            # Retrieval failures already degrade to a fallback answer inside the
+            # orchestrator, so anything reaching this guard is unexpected.
+            logger.exception("Chat request failed for session %s", session_id)
             payload = error_response(
                 code="chat_failed",
                 message=str(exc) or "Chat request failed",
                 recoverable=True,
             )
-            return JSONResponse(status_code=500, content=payload.model_dump())
+            return error_json_response(500, payload)
 
     @router.post(
         "/sessions/{session_id}/messages/stream",
@@ -73,70 +117,68 @@ def build_rag_chat_router() -> APIRouter:
     async def post_message_stream(
         session_id: str,
         request: RagChatRequest,
-        orchestrator: RagAgentOrchestrator = ORCHESTRATOR_DEPENDENCY,
+        orchestrator: RagAgentOrchestrator = orchestrator_dep,
     ) -> Response:
-        event_queue: asyncio.Queue[object] = asyncio.Queue()
-
-        async def on_stream_event(event: StreamEvent) -> None:
-            await event_queue.put(event)
+        # Unbounded, like the queue it replaced: retrieval must never block on a
+        # response body that is never iterated.
+        send_events, receive_events = anyio.create_memory_object_stream[StreamEvent](
+            max_buffer_size=math.inf
+        )
 
         async def collect_with_live_events() -> Any:
-            try:
+            # Closing the send side ends the event stream for the consumer.
+            async with send_events:
                 return await orchestrator.collect_evidence(
                     session_id=session_id,
                     request=request,
-                    event_sink=on_stream_event,
+                    event_sink=send_events.send,
                 )
-            finally:
-                await event_queue.put(_STREAM_EVENTS_DONE)
 
         retrieval_task: asyncio.Task[Any] = asyncio.create_task(collect_with_live_events())
 
-        preloaded_event: object = _NO_PRELOADED_EVENT
-        first_event_task: asyncio.Task[object] = asyncio.create_task(event_queue.get())
-        done, _pending = await asyncio.wait(
-            {retrieval_task, first_event_task},
-            return_when=asyncio.FIRST_COMPLETED,
-        )
+        async def cancel_retrieval() -> None:
+            receive_events.close()
+            if not retrieval_task.done():
+                retrieval_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await retrieval_task
 
-        if first_event_task in done:
-            preloaded_event = first_event_task.result()
-        else:
-            first_event_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await first_event_task
-
-        if retrieval_task in done and preloaded_event in (_NO_PRELOADED_EVENT, _STREAM_EVENTS_DONE):
+        # Wait for the first event or the end of retrieval, whichever comes first.
+        # Failures before any event is produced are reported as a JSON error.
+        first_event: StreamEvent | None = None
+        try:
+            first_event = await receive_events.receive()
+        except asyncio.CancelledError:
+            # The handler itself was cancelled; do not leave retrieval running.
+            await cancel_retrieval()
+            raise
+        except anyio.EndOfStream:
             try:
                 await retrieval_task
             except Exception as exc:  # pragma: no cover
+                logger.exception("Chat stream failed for session %s", session_id)
+                receive_events.close()
                 payload = error_response(
                     code="chat_failed",
                     message=str(exc) or "Chat request failed",
                     recoverable=True,
                 )
-                return JSONResponse(status_code=500, content=payload.model_dump())
+                return error_json_response(500, payload)
 
-        async def token_stream() -> AsyncIterator[str]:
+        async def token_stream() -> AsyncIterator[bytes]:
             try:
                 # Phase 1: Emit intermediate events as they are produced.
-                first_item = preloaded_event
-                if first_item is not _NO_PRELOADED_EVENT and first_item is not _STREAM_EVENTS_DONE:
-                    yield cast(StreamEvent, first_item).model_dump_json() + "\n"
-
-                if first_item is not _STREAM_EVENTS_DONE:
-                    while True:
-                        queued_item = await event_queue.get()
-                        if queued_item is _STREAM_EVENTS_DONE:
-                            break
-                        yield cast(StreamEvent, queued_item).model_dump_json() + "\n"
+                if first_event is not None:
+                    yield _encode_event_line(first_event)
+                async with receive_events:
+                    async for event in receive_events:
+                        yield _encode_event_line(event)
 
                 # Retrieval either succeeded or failed after some events already streamed.
                 try:
                     retrieval, _stream_events = await retrieval_task
                 except Exception:
-                    yield _STREAM_EVENTS_SEPARATOR
-                    yield _RETRIEVAL_ERROR_ANSWER
+                    logger.exception("Chat stream retrieval failed for session %s", session_id)
                     orchestrator._session_memory.append_turn(
                         session_id=session_id,
                         role="assistant",
@@ -145,30 +187,35 @@ def build_rag_chat_router() -> APIRouter:
                         citations=[],
                         tools_used=["chat_failed"],
                     )
-                    yield _STREAM_METADATA_SEPARATOR + json.dumps(
-                        {
-                            "citations": [],
-                            "mode": _HYBRID_MODE,
-                            "tools_used": ["chat_failed"],
-                        },
-                        default=str,
-                    )
+                    yield _RETRIEVAL_ERROR_STREAM_TAIL
                     return
 
                 # Group separator marks end of events, start of answer tokens.
-                yield _STREAM_EVENTS_SEPARATOR
-
-                # Phase 2: Stream answer tokens.
-                answer_parts: list[str] = []
+                yield _STREAM_EVENTS_SEPARATOR_BYTES
+
+                # Phase 2: Stream answer tokens, coalescing tokens that arrive in
+                # quick succession so each HTTP chunk carries a batch of them.
+                # The answer is accumulated once as UTF-8; unflushed bytes are the
+                # tail past ``flushed``.
+                answer_bytes = bytearray()
+                flushed = 0
+                last_flush = time.monotonic()
                 async for token in orchestrator.stream_synthesis(
                     prompt=request.prompt.strip(),
                     retrieval=retrieval,
                     reasoning_effort=request.reasoning_effort,
                 ):
-                    answer_parts.append(token)
-                    yield token
-
-                full_answer = "".join(answer_parts)
+                    answer_bytes += token.encode()
+                    now = time.monotonic()
+                    if (
+                        len(answer_bytes) - flushed >= _TOKEN_FLUSH_BYTES
+                        or now - last_flush >= _TOKEN_FLUSH_INTERVAL_SECONDS
+                    ):
+                        yield bytes(answer_bytes[flushed:])
+                        flushed = len(answer_bytes)
+                        last_flush = now
+
+                full_answer = answer_bytes.decode()
                 orchestrator._session_memory.append_turn(
                     session_id=session_id,
                     role="assistant",
@@ -178,21 +225,18 @@ def build_rag_chat_router() -> APIRouter:
                     tools_used=retrieval.tools_used,
                 )
 
-                # Phase 3: Metadata trailer.
+                # Phase 3: Metadata trailer, sent in the same chunk as any
+                # answer bytes still buffered.
+                # Citations are serialized straight to JSON and embedded as a
+                # fragment rather than dumped to dicts and re-walked by orjson.
                 metadata = {
-                    "citations": [c.model_dump() for c in retrieval.citations],
+                    "citations": orjson.Fragment(_CITATIONS_ADAPTER.dump_json(retrieval.citations)),
                     "mode": _HYBRID_MODE,
                     "tools_used": retrieval.tools_used,
                 }
-                yield _STREAM_METADATA_SEPARATOR + json.dumps(
-                    metadata,
-                    default=str,
-                )
+                yield bytes(answer_bytes[flushed:]) + _encode_metadata_trailer(metadata)
             finally:
-                if not retrieval_task.done():
-                    retrieval_task.cancel()
-                    with suppress(asyncio.CancelledError):
-                        await retrieval_task
+                await cancel_retrieval()
 
         return StreamingResponse(
             token_stream(),
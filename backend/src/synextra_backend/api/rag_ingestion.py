@@ -1,20 +1,32 @@
 from __future__ import annotations
 
-import time
-from typing import Annotated, cast
+import asyncio
+from collections.abc import Sequence
+from typing import Annotated, BinaryIO, cast
 
-from fastapi import APIRouter, Depends, File, Request, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, File, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from synextra import (
+    IngestionResult,
     Synextra,
     SynextraDocumentEncryptedError,
     SynextraDocumentParseError,
     SynextraIngestionError,
     SynextraUnsupportedMediaTypeError,
 )
-from synextra.repositories.rag_document_repository import RagDocumentRepository
+from synextra.repositories.rag_document_repository import (
+    ChunkRecord,
+    DocumentRecord,
+    RagDocumentRepository,
+)
 
-from synextra_backend.schemas.errors import ApiErrorResponse, error_response
+from synextra_backend.api.dependencies import bind_dependency
+from synextra_backend.schemas.errors import (
+    ApiErrorResponse,
+    error_json_response,
+    error_response,
+)
 from synextra_backend.schemas.rag_ingestion import RagChunk, RagIngestionResponse
 
 
@@ -32,16 +44,107 @@ def _get_synextra(request: Request) -> Synextra:
     return cast(Synextra, client)
 
 
+SYNEXTRA_DEPENDENCY = Depends(_get_synextra)
+REPOSITORY_DEPENDENCY = Depends(_get_repository)
+
+
+# Parsing and chunking are CPU-bound; cap how many uploads are processed at once
+# so concurrent ingests cannot pile decoded documents up in memory.
+_MAX_CONCURRENT_INGESTS = 4
+
+
+_PDF_MAGIC = b"%PDF"
+_PDF_CONTENT_TYPES = frozenset({"application/pdf", "application/x-pdf"})
+_PREVIEW_CHAR_LIMIT = 240
+
+
 def _is_pdf(*, filename: str | None, content_type: str | None, data: bytes) -> bool:
-    if content_type and content_type.lower().startswith("application/pdf"):
+    # The magic-byte check is a plain memcmp, so it runs first.
+    if data.startswith(_PDF_MAGIC):
         return True
-    if filename and filename.lower().endswith(".pdf"):
+    if content_type and content_type.partition(";")[0].strip().lower() in _PDF_CONTENT_TYPES:
         return True
-    return data.startswith(b"%PDF")
+    # Only the extension is lowercased, not the whole filename.
+    return filename is not None and filename[-4:].lower() == ".pdf"
+
 
+def _ingest_spooled(
+    synextra: Synextra, upload: BinaryIO, *, filename: str, content_type: str | None
+) -> IngestionResult:
+    # Runs in a worker thread: the body is read from the spooled upload here.
+    upload.seek(0)
+    return synextra.ingest(upload.read(), filename=filename, content_type=content_type)
 
-def build_rag_ingestion_router() -> APIRouter:
-    router = APIRouter(prefix="/v1/rag", tags=["rag"])
+
+def _preview_text(text: str) -> str:
+    return text[:_PREVIEW_CHAR_LIMIT] + ("…" if len(text) > _PREVIEW_CHAR_LIMIT else "")
+
+
+def _make_chunk(chunk: ChunkRecord) -> RagChunk:
+    # Chunk records were produced by the chunker and already satisfy the schema,
+    # so the response model is built without re-running field validation.
+    return RagChunk.model_construct(
+        chunk_id=chunk.chunk_id,
+        page_number=chunk.page_number,
+        chunk_index=chunk.chunk_index,
+        token_count=chunk.token_count,
+        citation_span=chunk.citation_span,
+        preview_text=chunk.preview_text or _preview_text(chunk.text),
+        bounding_box=chunk.bounding_box,
+    )
+
+
+def _ingestion_response(
+    document: DocumentRecord, chunks: Sequence[ChunkRecord]
+) -> RagIngestionResponse:
+    return RagIngestionResponse.model_construct(
+        document_id=document.document_id,
+        filename=document.filename,
+        mime_type=document.mime_type,
+        checksum_sha256=document.checksum_sha256,
+        page_count=document.page_count,
+        chunk_count=len(chunks),
+        chunks=[_make_chunk(chunk) for chunk in chunks],
+    )
+
+
+def _stored_document_response(
+    repository: RagDocumentRepository, document_id: str, *, missing_message: str
+) -> RagIngestionResponse | Response:
+    document = repository.get_document(document_id)
+    if document is None:  # pragma: no cover
+        payload = error_response(
+            code="document_missing",
+            message=missing_message,
+            recoverable=False,
+        )
+        return error_json_response(500, payload)
+    return _ingestion_response(document, repository.list_chunks(document_id))
+
+
+def build_rag_ingestion_router(*, synextra: Synextra | None = None) -> APIRouter:
+    synextra_dep = bind_dependency(synextra, SYNEXTRA_DEPENDENCY)
+    repository_dep = bind_dependency(
+        synextra.repository if synextra is not None else None, REPOSITORY_DEPENDENCY
+    )
+    router = APIRouter(prefix="/v1/rag", tags=["rag"], default_response_class=ORJSONResponse)
+    ingest_slots = asyncio.Semaphore(_MAX_CONCURRENT_INGESTS)
+
+    async def ingest_off_loop(
+        synextra: Synextra, file: UploadFile, *, filename: str
+    ) -> IngestionResult:
+        # Run the synchronous SDK ingest in a worker thread so the event loop keeps
+        # serving other requests while a document is parsed. The upload stays
+        # spooled until a slot is free, so queued uploads do not hold their
+        # bodies in memory while they wait.
+        async with ingest_slots:
+            return await run_in_threadpool(
+                _ingest_spooled,
+                synextra,
+                file.file,
+                filename=filename,
+                content_type=file.content_type,
+            )
 
     @router.post(
         "/documents",
@@ -55,79 +158,44 @@ def build_rag_ingestion_router() -> APIRouter:
     )
     async def ingest_document(
         file: Annotated[UploadFile, File(...)],
-        synextra: Annotated[Synextra, Depends(_get_synextra)],
-        repository: Annotated[RagDocumentRepository, Depends(_get_repository)],
-    ) -> RagIngestionResponse | JSONResponse:
-        _started = time.perf_counter()
-        data = await file.read()
-
+        synextra: Synextra = synextra_dep,
+        repository: RagDocumentRepository = repository_dep,
+    ) -> RagIngestionResponse | Response:
         try:
-            result = synextra.ingest(
-                data,
-                filename=file.filename or "upload",
-                content_type=file.content_type,
-            )
+            result = await ingest_off_loop(synextra, file, filename=file.filename or "upload")
         except SynextraUnsupportedMediaTypeError as exc:
             payload = error_response(
                 code="unsupported_media_type",
                 message=str(exc),
                 recoverable=False,
             )
-            return JSONResponse(status_code=415, content=payload.model_dump())
+            return error_json_response(415, payload)
         except SynextraDocumentEncryptedError as exc:
             payload = error_response(
                 code="document_encrypted",
                 message=str(exc),
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
         except SynextraDocumentParseError as exc:
             payload = error_response(
                 code="document_parse_failed",
                 message=str(exc),
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
         except SynextraIngestionError as exc:
             payload = error_response(
                 code="document_ingestion_failed",
                 message=str(exc),
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
 
-        document = repository.get_document(result.document_id)
-        if document is None:  # pragma: no cover
-            payload = error_response(
-                code="document_missing",
-                message="Document was ingested but cannot be located",
-                recoverable=False,
-            )
-            return JSONResponse(status_code=500, content=payload.model_dump())
-
-        chunks = repository.list_chunks(result.document_id)
-
-        _ = int((time.perf_counter() - _started) * 1000)
-
-        return RagIngestionResponse(
-            document_id=document.document_id,
-            filename=document.filename,
-            mime_type=document.mime_type,
-            checksum_sha256=document.checksum_sha256,
-            page_count=document.page_count,
-            chunk_count=len(chunks),
-            chunks=[
-                RagChunk(
-                    chunk_id=chunk.chunk_id,
-                    page_number=chunk.page_number,
-                    chunk_index=chunk.chunk_index,
-                    token_count=chunk.token_count,
-                    citation_span=chunk.citation_span,
-                    preview_text=chunk.text[:240] + ("…" if len(chunk.text) > 240 else ""),
-                    bounding_box=chunk.bounding_box,
-                )
-                for chunk in chunks
-            ],
+        return _stored_document_response(
+            repository,
+            result.document_id,
+            missing_message="Document was ingested but cannot be located",
         )
 
     @router.post(
@@ -142,80 +210,46 @@ def build_rag_ingestion_router() -> APIRouter:
     )
     async def ingest_pdf(
         file: Annotated[UploadFile, File(...)],
-        synextra: Annotated[Synextra, Depends(_get_synextra)],
-        repository: Annotated[RagDocumentRepository, Depends(_get_repository)],
-    ) -> RagIngestionResponse | JSONResponse:
-        started = time.perf_counter()
-        data = await file.read()
+        synextra: Synextra = synextra_dep,
+        repository: RagDocumentRepository = repository_dep,
+    ) -> RagIngestionResponse | Response:
+        # Only the magic bytes are needed to reject non-PDF uploads.
+        head = await file.read(len(_PDF_MAGIC))
 
-        if not _is_pdf(filename=file.filename, content_type=file.content_type, data=data):
+        if not _is_pdf(filename=file.filename, content_type=file.content_type, data=head):
             payload = error_response(
                 code="unsupported_media_type",
                 message="Only PDF uploads are supported",
                 recoverable=False,
             )
-            return JSONResponse(status_code=415, content=payload.model_dump())
+            return error_json_response(415, payload)
 
         try:
-            result = synextra.ingest(
-                data,
-                filename=file.filename or "upload.pdf",
-                content_type=file.content_type,
-            )
+            result = await ingest_off_loop(synextra, file, filename=file.filename or "upload.pdf")
         except SynextraDocumentEncryptedError:
             payload = error_response(
                 code="pdf_encrypted",
                 message="PDF is encrypted or requires a password",
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
         except SynextraDocumentParseError:
             payload = error_response(
                 code="pdf_parse_failed",
                 message="Failed to parse PDF",
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
         except SynextraIngestionError as exc:
             payload = error_response(
                 code="pdf_ingestion_failed",
                 message=str(exc),
                 recoverable=False,
             )
-            return JSONResponse(status_code=422, content=payload.model_dump())
+            return error_json_response(422, payload)
 
-        document = repository.get_document(result.document_id)
-        if document is None:  # pragma: no cover
-            payload = error_response(
-                code="document_missing",
-                message="PDF was ingested but cannot be located",
-                recoverable=False,
-            )
-            return JSONResponse(status_code=500, content=payload.model_dump())
-
-        chunks = repository.list_chunks(document.document_id)
-
-        _ = int((time.perf_counter() - started) * 1000)
-
-        return RagIngestionResponse(
-            document_id=document.document_id,
-            filename=document.filename,
-            mime_type=document.mime_type,
-            checksum_sha256=document.checksum_sha256,
-            page_count=document.page_count,
-            chunk_count=len(chunks),
-            chunks=[
-                RagChunk(
-                    chunk_id=chunk.chunk_id,
-                    page_number=chunk.page_number,
-                    chunk_index=chunk.chunk_index,
-                    token_count=chunk.token_count,
-                    citation_span=chunk.citation_span,
-                    preview_text=chunk.text[:240] + ("…" if len(chunk.text) > 240 else ""),
-                    bounding_box=chunk.bounding_box,
-                )
-                for chunk in chunks
-            ],
+        return _stored_document_response(
+            repository, result.document_id, missing_message="PDF was ingested but cannot be located"
         )
 
     return router
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Annotated, cast
+from typing import cast
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from synextra.repositories.rag_document_repository import RagDocumentRepository
 from synextra.services.embedded_store_persistence import EmbeddedStorePersistence
 
-from synextra_backend.schemas.errors import ApiErrorResponse, error_response
+from synextra_backend.api.dependencies import bind_dependency
+from synextra_backend.schemas.errors import (
+    ApiErrorResponse,
+    error_json_response,
+    error_response,
+)
 from synextra_backend.schemas.rag_persistence import RagPersistenceResponse
 
 
@@ -25,8 +31,18 @@ def _get_embedded_persistence(request: Request) -> EmbeddedStorePersistence:
     return cast(EmbeddedStorePersistence, persistence)
 
 
-def build_rag_persistence_router() -> APIRouter:
-    router = APIRouter(prefix="/v1/rag", tags=["rag"])
+REPOSITORY_DEPENDENCY = Depends(_get_repository)
+EMBEDDED_PERSISTENCE_DEPENDENCY = Depends(_get_embedded_persistence)
+
+
+def build_rag_persistence_router(
+    *,
+    rag_repository: RagDocumentRepository | None = None,
+    embedded_store_persistence: EmbeddedStorePersistence | None = None,
+) -> APIRouter:
+    repository_dep = bind_dependency(rag_repository, REPOSITORY_DEPENDENCY)
+    persistence_dep = bind_dependency(embedded_store_persistence, EMBEDDED_PERSISTENCE_DEPENDENCY)
+    router = APIRouter(prefix="/v1/rag", tags=["rag"], default_response_class=ORJSONResponse)
 
     @router.post(
         "/documents/{document_id}/persist/embedded",
@@ -39,9 +55,9 @@ def build_rag_persistence_router() -> APIRouter:
     )
     async def persist_embedded(
         document_id: str,
-        repository: Annotated[RagDocumentRepository, Depends(_get_repository)],
-        persistence: Annotated[EmbeddedStorePersistence, Depends(_get_embedded_persistence)],
-    ) -> RagPersistenceResponse | JSONResponse:
+        repository: RagDocumentRepository = repository_dep,
+        persistence: EmbeddedStorePersistence = persistence_dep,
+    ) -> RagPersistenceResponse | Response:
         document = repository.get_document(document_id)
         if document is None:
             payload = error_response(
@@ -49,9 +65,12 @@ def build_rag_persistence_router() -> APIRouter:
                 message="Document not found",
                 recoverable=False,
             )
-            return JSONResponse(status_code=404, content=payload.model_dump())
+            return error_json_response(404, payload)
 
-        duration_ms, _signature, indexed_chunk_count = persistence.persist(document_id=document_id)
+        # Building the BM25 index is CPU-bound; keep it off the event loop.
+        duration_ms, _signature, indexed_chunk_count = await run_in_threadpool(
+            persistence.persist, document_id=document_id
+        )
         return RagPersistenceResponse(
             document_id=document_id,
             store="embedded",
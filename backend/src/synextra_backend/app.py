@@ -3,6 +3,7 @@ from typing import Final
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from synextra import Synextra
 from synextra.repositories.rag_document_repository import (
     InMemoryRagDocumentRepository,
@@ -35,6 +36,7 @@ def create_app(
     app = FastAPI(
         title="synextra-backend",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
 
     # Shared state.
@@ -48,13 +50,19 @@ def create_app(
     app.state.document_store = synextra.document_store
     app.state.embedded_store_persistence = synextra.embedded_store_persistence
     app.state.rag_orchestrator = synextra.orchestrator
-    app.state.pipeline_runtime = PipelineRuntime(synextra=synextra)
+    pipeline_runtime = PipelineRuntime(synextra=synextra)
+    app.state.pipeline_runtime = pipeline_runtime
 
     app.include_router(build_health_router(service_name=normalized_service_name))
-    app.include_router(build_rag_ingestion_router())
-    app.include_router(build_rag_persistence_router())
-    app.include_router(build_rag_chat_router())
-    app.include_router(build_pipeline_router())
+    app.include_router(build_rag_ingestion_router(synextra=synextra))
+    app.include_router(
+        build_rag_persistence_router(
+            rag_repository=synextra.repository,
+            embedded_store_persistence=synextra.embedded_store_persistence,
+        )
+    )
+    app.include_router(build_rag_chat_router(rag_orchestrator=synextra.orchestrator))
+    app.include_router(build_pipeline_router(pipeline_runtime=pipeline_runtime))
     return app
 
 
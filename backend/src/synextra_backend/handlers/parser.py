@@ -2,7 +2,8 @@
 
 This module originally contained a small script snippet used during early
 experiments. The runtime snippet has been removed to avoid import-time side
-effects during application startup and test collection.
+effects during application startup and test collection; run
+``python -m synextra_backend.handlers.parser <pdf> <out.jsonl>`` instead.
 
 The backend RAG implementation uses :mod:`synextra.services` instead.
 These helpers remain as a lightweight reference.
@@ -10,11 +11,14 @@ These helpers remain as a lightweight reference.
 
 from __future__ import annotations
 
+import argparse
 import pathlib
 from collections.abc import Iterator
 from typing import Any
 
+import orjson
 import pymupdf
+from synextra.services.pdf_ingestion import PdfStrategy, choose_pdf_strategy, map_page_ranges
 
 
 def _open_pdf(pdf_path: pathlib.Path) -> Any:
@@ -28,40 +32,115 @@ def _open_pdf(pdf_path: pathlib.Path) -> Any:
     return pymupdf_module.open(pdf_path)
 
 
-def extract_pdf_text(pdf_path: str | pathlib.Path, *, sort: bool = True) -> str:
-    """Extract full text from a PDF as page-separated text."""
+def _page_blocks(page: Any, *, sort: bool) -> list[dict[str, object]]:
+    blocks: list[dict[str, object]] = []
+    for x0, y0, x1, y1, text, block_no, block_type in page.get_text("blocks", sort=sort):
+        # pymupdf defines a text block as type "0"
+        # ignore all other blocks
+        if block_type != 0:
+            continue
+
+        cleaned = " ".join(text.split())
+        if not cleaned:
+            continue
+
+        blocks.append(
+            {
+                "page": page.number,  # 0-based
+                "bounding_box": [x0, y0, x1, y1],  # PDF coordinates
+                "block_no": block_no,
+                "text": cleaned,
+            }
+        )
+    return blocks
+
+
+def _page_range_text(pdf_path: pathlib.Path, start: int, stop: int, sort: bool) -> list[str]:
+    with _open_pdf(pdf_path) as doc:
+        return [doc[index].get_text("text", sort=sort) for index in range(start, stop)]
+
+
+def _page_range_blocks(
+    pdf_path: pathlib.Path, start: int, stop: int, sort: bool
+) -> list[list[dict[str, object]]]:
+    with _open_pdf(pdf_path) as doc:
+        return [_page_blocks(doc[index], sort=sort) for index in range(start, stop)]
+
+
+def extract_pdf_text(
+    pdf_path: str | pathlib.Path, *, sort: bool = True, strategy: PdfStrategy | None = None
+) -> str:
+    """Extract full text from a PDF as page-separated text.
+
+    Large documents are split into page ranges that worker processes extract
+    in parallel, using the same strategy as the SDK's PDF ingestion.
+    """
 
     pdf_path = pathlib.Path(pdf_path)
 
     with _open_pdf(pdf_path) as doc:
-        pages = []
-        for page in doc:
-            pages.append(page.get_text("text", sort=sort))
-        return "\f".join(pages)
+        page_count = int(doc.page_count)
+        strategy = strategy or choose_pdf_strategy(page_count)
+        if strategy.name == "inline":
+            return "\f".join(page.get_text("text", sort=sort) for page in doc)
+
+    pages = map_page_ranges(
+        _page_range_text, pdf_path, page_count=page_count, strategy=strategy, sort=sort
+    )
+    return "\f".join(pages)
 
 
 def extract_blocks(
-    pdf_path: str | pathlib.Path, *, sort: bool = True
+    pdf_path: str | pathlib.Path, *, sort: bool = True, strategy: PdfStrategy | None = None
 ) -> Iterator[dict[str, object]]:
-    """Yield normalized text blocks with bounding boxes."""
+    """Yield normalized text blocks with bounding boxes.
+
+    Blocks are yielded in page order; large documents are extracted in worker
+    processes as for :func:`extract_pdf_text`.
+    """
 
     pdf_path = pathlib.Path(pdf_path)
 
     with _open_pdf(pdf_path) as doc:
-        for page in doc:
-            for x0, y0, x1, y1, text, block_no, block_type in page.get_text("blocks", sort=sort):
-                # pymupdf defines a text block as type "0"
-                # ignore all other blocks
-                if block_type != 0:
-                    continue
-
-                cleaned = " ".join(str(text).split())
-                if not cleaned:
-                    continue
-
-                yield {
-                    "page": page.number,  # 0-based
-                    "bounding_box": [x0, y0, x1, y1],  # PDF coordinates
-                    "block_no": block_no,
-                    "text": cleaned,
-                }
+        page_count = int(doc.page_count)
+        strategy = strategy or choose_pdf_strategy(page_count)
+        if strategy.name == "inline":
+            for page in doc:
+                yield from _page_blocks(page, sort=sort)
+            return
+
+    for page_blocks in map_page_ranges(
+        _page_range_blocks, pdf_path, page_count=page_count, strategy=strategy, sort=sort
+    ):
+        yield from page_blocks
+
+
+def write_blocks_jsonl(
+    pdf_path: str | pathlib.Path, out_path: str | pathlib.Path, *, sort: bool = True
+) -> int:
+    """Stream :func:`extract_blocks` to ``out_path`` as JSON Lines.
+
+    Blocks are written as they are extracted, so memory use does not grow
+    with the size of the PDF. Returns the number of blocks written.
+    """
+
+    count = 0
+    with pathlib.Path(out_path).open("wb") as out:
+        for block in extract_blocks(pdf_path, sort=sort):
+            out.write(orjson.dumps(block))
+            out.write(b"\n")
+            count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Write the text blocks of a PDF as JSON Lines.")
+    parser.add_argument("pdf", type=pathlib.Path)
+    parser.add_argument("out", type=pathlib.Path)
+    args = parser.parse_args(argv)
+    count = write_blocks_jsonl(args.pdf, args.out)
+    print(f"Wrote {count} blocks to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
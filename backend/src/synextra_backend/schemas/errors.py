@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import uuid
+import secrets
 
+from fastapi import Response
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -29,7 +30,7 @@ class ApiErrorResponse(BaseModel):
 
 
 def new_request_id() -> str:
-    return uuid.uuid4().hex
+    return secrets.token_hex(16)
 
 
 def error_response(
@@ -47,3 +48,12 @@ def error_response(
             request_id=request_id or new_request_id(),
         )
     )
+
+
+def error_json_response(status_code: int, payload: ApiErrorResponse) -> Response:
+    """Render an error payload to JSON in one pass through pydantic-core."""
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
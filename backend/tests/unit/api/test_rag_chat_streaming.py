@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
@@ -130,9 +131,44 @@ def _split_stream_body(body: str) -> tuple[str, dict[str, Any]]:
     return answer, metadata
 
 
+async def _response_body_writes(app: FastAPI, path: str, payload: dict[str, Any]) -> list[bytes]:
+    """Drive ``app`` over raw ASGI and return each non-empty response body write."""
+    request_body = json.dumps(payload).encode()
+    received = False
+    writes: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": request_body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            writes.append(message["body"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("testclient", 123),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return writes
+
+
 @pytest.mark.asyncio
-async def test_stream_yields_individual_tokens() -> None:
-    """Verify tokens arrive individually, not in fixed-size chunks."""
+async def test_stream_answer_reassembles_from_tokens() -> None:
+    """Verify the streamed answer is the concatenation of the synthesis tokens."""
     tokens = ["The ", "answer ", "is ", "42."]
     orchestrator = _FakeOrchestrator(tokens=tokens)
     app = FastAPI()
@@ -158,6 +194,31 @@ async def test_stream_yields_individual_tokens() -> None:
     assert metadata["tools_used"] == ["bm25_search"]
 
 
+@pytest.mark.asyncio
+async def test_stream_coalesces_small_tokens_and_sends_tail_with_metadata(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("synextra_backend.api.rag_chat._TOKEN_FLUSH_BYTES", 4)
+    monkeypatch.setattr("synextra_backend.api.rag_chat._TOKEN_FLUSH_INTERVAL_SECONDS", 60.0)
+    app = FastAPI()
+    app.state.rag_orchestrator = _FakeOrchestrator(tokens=["ab", "cd", "e"])
+    app.include_router(build_rag_chat_router())
+
+    # httpx's ASGI transport joins the body, so the writes are read off the
+    # ASGI send channel directly.
+    chunks = await _response_body_writes(
+        app, "/v1/rag/sessions/s1/messages/stream", {"prompt": "What is the answer?"}
+    )
+
+    separator = _STREAM_EVENTS_SEPARATOR.encode()
+    answer_chunks = chunks[chunks.index(separator) + 1 :]
+    assert answer_chunks[0] == b"abcd"
+    tail, trailer = answer_chunks[1].split(_STREAM_METADATA_SEPARATOR.encode(), 1)
+    assert tail == b"e"
+    assert json.loads(trailer)["tools_used"] == ["bm25_search"]
+    assert len(answer_chunks) == 2
+
+
 @pytest.mark.asyncio
 async def test_stream_includes_citations_in_metadata() -> None:
     citations = [
@@ -435,3 +496,45 @@ async def test_stream_multiple_events_are_newline_separated() -> None:
     assert parsed_events[2]["event"] == "review"
     assert parsed_events[2]["verdict"] == "approved"
     assert answer == "Done."
+
+
+@pytest.mark.asyncio
+async def test_post_message_returns_orchestrator_response() -> None:
+    app = FastAPI()
+    app.state.rag_orchestrator = _FakeOrchestrator(tokens=["The ", "answer."])
+    app.include_router(build_rag_chat_router())
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.post(
+            "/v1/rag/sessions/s1/messages",
+            json={"prompt": "What is the answer?"},
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["session_id"] == "s1"
+    assert body["answer"] == "The answer."
+
+
+@pytest.mark.asyncio
+async def test_post_message_logs_and_returns_500_on_failure(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    app = FastAPI()
+    app.state.rag_orchestrator = _FakeOrchestrator(should_raise=True)
+    app.include_router(build_rag_chat_router())
+
+    transport = ASGITransport(app=app)
+    with caplog.at_level(logging.ERROR, logger="synextra_backend.api.rag_chat"):
+        async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.post(
+                "/v1/rag/sessions/s1/messages",
+                json={"prompt": "What is the answer?"},
+            )
+
+    assert response.status_code == 500
+    error = response.json()["error"]
+    assert error["code"] == "chat_failed"
+    assert error["message"] == "stream failed"
+    assert any(record.exc_info for record in caplog.records)
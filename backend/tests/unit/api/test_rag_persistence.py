@@ -79,7 +79,9 @@ async def test_embedded_persistence_endpoint_returns_404_for_unknown_document()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         response = await client.post("/v1/rag/documents/missing/persist/embedded")
+        second = await client.post("/v1/rag/documents/missing/persist/embedded")
 
     assert response.status_code == 404
     body = response.json()
     assert body["error"]["code"] == "document_not_found"
+    assert body["error"]["request_id"] != second.json()["error"]["request_id"]
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from synextra.services.pdf_ingestion import PdfStrategy
+
+from synextra_backend.handlers.parser import extract_blocks, extract_pdf_text
+
+_FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "1706.03762v7.pdf"
+
+
+def test_extract_blocks_and_text_match_across_strategies() -> None:
+    strategy = PdfStrategy(name="process", pages_per_task=4, workers=2)
+
+    assert list(extract_blocks(_FIXTURE, strategy=strategy)) == list(extract_blocks(_FIXTURE))
+    assert extract_pdf_text(_FIXTURE, strategy=strategy) == extract_pdf_text(_FIXTURE)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from synextra.repositories.rag_document_repository import ChunkRecord
+from synextra.retrieval.bm25_search import Bm25Index
+
+
+def _record(index: int, text: str) -> ChunkRecord:
+    return ChunkRecord(
+        chunk_id=f"doc::{index}",
+        document_id="doc",
+        page_number=0,
+        chunk_index=index,
+        token_count=len(text.split()),
+        citation_span="p0",
+        text=text,
+        bounding_box=[0.0, 0.0, 1.0, 1.0],
+        preview_text=text,
+    )
+
+
+def test_search_returns_best_chunks_first_and_keeps_corpus_order_on_ties() -> None:
+    texts = [
+        "beta",
+        "alpha alpha",
+        "alpha",
+        "gamma",
+        "alpha",
+        "delta",
+        "alpha alpha",
+        "epsilon",
+        "zeta",
+        "eta",
+        "theta",
+        "iota",
+    ]
+    index = Bm25Index(
+        document_id="doc",
+        chunks=[_record(i, text) for i, text in enumerate(texts)],
+        signature="sig",
+    )
+
+    evidence = index.search(query="alpha", top_k=3)
+
+    assert [chunk.chunk_id for chunk in evidence] == ["doc::1", "doc::6", "doc::2"]
+    assert evidence[0].score == evidence[1].score > evidence[2].score
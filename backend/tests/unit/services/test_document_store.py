@@ -126,3 +126,18 @@ class TestDocumentStore:
         assert result is not None
         assert "2 | Line two." in result
         assert "3 | Line three." in result
+
+    def test_read_full_page_reflects_replaced_pages(self) -> None:
+        store = self._store_with_doc()
+        first = store.read_page("doc1", 0)
+        assert store.read_page("doc1", 0) == first
+
+        store.store_pages(
+            document_id="doc1",
+            filename="test.pdf",
+            pages=[PageText(page_number=0, lines=["Replaced."], line_count=1)],
+        )
+        result = store.read_page("doc1", 0)
+        assert result is not None
+        assert "1 | Replaced." in result
+        assert "Line one." not in result
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from synextra.services.pdf_ingestion import extract_pdf_blocks
+import pytest
+from synextra.services.pdf_ingestion import (
+    PdfStrategy,
+    choose_pdf_strategy,
+    extract_pdf_blocks,
+    iter_pdf_page_blocks,
+)
 
 
 def test_extract_pdf_blocks_reads_fixture() -> None:
@@ -20,3 +26,30 @@ def test_extract_pdf_blocks_reads_fixture() -> None:
     assert sample.block_no >= 0
     assert len(sample.bounding_box) == 4
     assert sample.text
+
+
+def test_choose_pdf_strategy_uses_processes_only_for_large_documents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+
+    assert choose_pdf_strategy(10).name == "inline"
+    assert choose_pdf_strategy(500).name == "inline"
+
+    large = choose_pdf_strategy(600)
+    assert large == PdfStrategy(name="process", pages_per_task=150, workers=4)
+    assert choose_pdf_strategy(4000).pages_per_task == 500
+
+
+def test_process_strategy_matches_inline_extraction() -> None:
+    fixture = Path(__file__).resolve().parents[2] / "fixtures" / "1706.03762v7.pdf"
+    data = fixture.read_bytes()
+
+    inline = list(iter_pdf_page_blocks(data))
+    in_processes = list(
+        iter_pdf_page_blocks(
+            data, strategy=PdfStrategy(name="process", pages_per_task=4, workers=2)
+        )
+    )
+
+    assert in_processes == inline
@@ -215,6 +215,70 @@ async def test_collect_evidence_returns_retrieval_result_with_answer(
     assert events == []
 
 
+@pytest.mark.asyncio
+async def test_collect_evidence_reuses_retrieval_until_corpus_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    orchestrator = _orchestrator()
+    calls: list[str] = []
+
+    async def _fake_call_agent(**kwargs: Any) -> AgentCallResult:
+        calls.append(kwargs["prompt"])
+        return AgentCallResult(
+            output_text="Agent answer.",
+            evidence=[_chunk(chunk_id="c1", text="Evidence text.")],
+            tools_used=["bm25_search"],
+        )
+
+    monkeypatch.setattr(orchestrator, "_call_agent", _fake_call_agent)
+
+    first, _ = await orchestrator.collect_evidence(
+        session_id="s1", request=RagChatRequest(prompt="What is it?")
+    )
+    second, _ = await orchestrator.collect_evidence(
+        session_id="s2", request=RagChatRequest(prompt="  What is   it? ")
+    )
+    assert calls == ["What is it?"]
+    assert second == first
+
+    orchestrator._document_store.store_pages(document_id="doc2", filename="b.pdf", pages=[])
+    await orchestrator.collect_evidence(
+        session_id="s1", request=RagChatRequest(prompt="What is it?")
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_collect_evidence_skips_cache_for_other_models_and_degraded_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    orchestrator = _orchestrator()
+    calls: list[str] = []
+    tools_used = ["bm25_search"]
+
+    async def _fake_call_agent(**kwargs: Any) -> AgentCallResult:
+        calls.append(kwargs["prompt"])
+        return AgentCallResult(
+            output_text="Agent answer.",
+            evidence=[_chunk(chunk_id="c1", text="Evidence text.")],
+            tools_used=list(tools_used),
+        )
+
+    monkeypatch.setattr(orchestrator, "_call_agent", _fake_call_agent)
+    request = RagChatRequest(prompt="What is it?")
+
+    await orchestrator.collect_evidence(session_id="s1", request=request)
+    monkeypatch.setenv("SYNEXTRA_CHAT_MODEL", "other-model")
+    await orchestrator.collect_evidence(session_id="s1", request=request)
+    assert len(calls) == 2
+
+    tools_used.append("citation_validation_failed")
+    monkeypatch.setenv("SYNEXTRA_CHAT_MODEL", "third-model")
+    await orchestrator.collect_evidence(session_id="s1", request=request)
+    await orchestrator.collect_evidence(session_id="s1", request=request)
+    assert len(calls) == 4
+
+
 @pytest.mark.asyncio
 async def test_stream_synthesis_yields_tokens() -> None:
     emitted_answer = "The Transformer model."
@@ -366,6 +366,7 @@ class Synextra:
                         filename=resolved_filename,
                         content_type=resolved_content_type,
                         document_id=existing.document_id,
+                        checksum_sha256=checksum,
                     )
                 except PdfEncryptedError as exc:
                     raise SynextraDocumentEncryptedError(
@@ -405,6 +406,7 @@ class Synextra:
                 filename=resolved_filename,
                 content_type=resolved_content_type,
                 document_id=document_id,
+                checksum_sha256=checksum,
             )
         except PdfEncryptedError as exc:
             raise SynextraDocumentEncryptedError("PDF is encrypted or requires a password") from exc
@@ -421,20 +423,20 @@ class Synextra:
             page_count=parsed.page_count,
         )
 
-        chunk_records: list[ChunkRecord] = []
-        for chunk in parsed.chunks:
-            chunk_records.append(
-                ChunkRecord(
-                    chunk_id=chunk.chunk_id,
-                    document_id=document_record.document_id,
-                    page_number=chunk.page_number,
-                    chunk_index=chunk.chunk_index,
-                    token_count=chunk.token_count,
-                    citation_span=chunk.citation_span,
-                    text=chunk.text,
-                    bounding_box=chunk.bounding_box,
-                )
+        chunk_records = [
+            ChunkRecord(
+                chunk_id=chunk.chunk_id,
+                document_id=document_record.document_id,
+                page_number=chunk.page_number,
+                chunk_index=chunk.chunk_index,
+                token_count=chunk.token_count,
+                citation_span=chunk.citation_span,
+                text=chunk.text,
+                bounding_box=chunk.bounding_box,
+                preview_text=chunk.preview_text,
             )
+            for chunk in parsed.chunks
+        ]
 
         self._repository.replace_chunks(document_record.document_id, chunk_records)
         self._document_store.store_pages(
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentRecord:
     document_id: str
     filename: str
@@ -15,7 +16,7 @@ class DocumentRecord:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChunkRecord:
     chunk_id: str
     document_id: str
@@ -25,9 +26,11 @@ class ChunkRecord:
     citation_span: str
     text: str
     bounding_box: list[float]
+    # Filled by the chunker at ingest; empty when the caller did not supply one.
+    preview_text: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmbeddedPersistenceRecord:
     document_id: str
     indexed_chunk_count: int
@@ -61,11 +64,11 @@ class RagDocumentRepository:
     def replace_chunks(
         self,
         document_id: str,
-        chunks: list[ChunkRecord],
+        chunks: Sequence[ChunkRecord],
     ) -> None:  # pragma: no cover
         raise NotImplementedError
 
-    def list_chunks(self, document_id: str) -> list[ChunkRecord]:  # pragma: no cover
+    def list_chunks(self, document_id: str) -> tuple[ChunkRecord, ...]:  # pragma: no cover
         raise NotImplementedError
 
     def mark_embedded_persisted(
@@ -84,19 +87,22 @@ class InMemoryRagDocumentRepository(RagDocumentRepository):
         self._lock = threading.RLock()
         self._documents: dict[str, DocumentRecord] = {}
         self._documents_by_checksum: dict[str, str] = {}
-        self._chunks_by_document: dict[str, list[ChunkRecord]] = {}
+        self._chunks_by_document: dict[str, tuple[ChunkRecord, ...]] = {}
         self._embedded_persistence: dict[str, EmbeddedPersistenceRecord] = {}
 
+    # Readers do not take the lock: each is a single dict lookup, which is atomic,
+    # and writers only ever store new values instead of mutating stored ones.
+    # upsert_document stores the document before its checksum entry, so a
+    # checksum hit always resolves.
+
     def get_document(self, document_id: str) -> DocumentRecord | None:
-        with self._lock:
-            return self._documents.get(document_id)
+        return self._documents.get(document_id)
 
     def get_document_by_checksum(self, checksum_sha256: str) -> DocumentRecord | None:
-        with self._lock:
-            document_id = self._documents_by_checksum.get(checksum_sha256)
-            if not document_id:
-                return None
-            return self._documents.get(document_id)
+        document_id = self._documents_by_checksum.get(checksum_sha256)
+        if not document_id:
+            return None
+        return self._documents.get(document_id)
 
     def upsert_document(
         self,
@@ -107,41 +113,40 @@ class InMemoryRagDocumentRepository(RagDocumentRepository):
         checksum_sha256: str,
         page_count: int,
     ) -> DocumentRecord:
+        # Records are immutable, so they are built before taking the lock.
+        record = DocumentRecord(
+            document_id=document_id,
+            filename=filename,
+            mime_type=mime_type,
+            checksum_sha256=checksum_sha256,
+            page_count=page_count,
+            created_at=datetime.now(UTC),
+        )
         with self._lock:
-            now = datetime.now(UTC)
-            record = DocumentRecord(
-                document_id=document_id,
-                filename=filename,
-                mime_type=mime_type,
-                checksum_sha256=checksum_sha256,
-                page_count=page_count,
-                created_at=now,
-            )
             self._documents[document_id] = record
             self._documents_by_checksum[checksum_sha256] = document_id
-            return record
+        return record
 
-    def replace_chunks(self, document_id: str, chunks: list[ChunkRecord]) -> None:
+    def replace_chunks(self, document_id: str, chunks: Sequence[ChunkRecord]) -> None:
+        # Chunks are frozen into a tuple once so readers can share it uncopied.
         with self._lock:
-            self._chunks_by_document[document_id] = list(chunks)
+            self._chunks_by_document[document_id] = tuple(chunks)
 
-    def list_chunks(self, document_id: str) -> list[ChunkRecord]:
-        with self._lock:
-            return list(self._chunks_by_document.get(document_id, []))
+    def list_chunks(self, document_id: str) -> tuple[ChunkRecord, ...]:
+        return self._chunks_by_document.get(document_id, ())
 
     def mark_embedded_persisted(
         self, *, document_id: str, indexed_chunk_count: int, signature: str
     ) -> EmbeddedPersistenceRecord:
+        record = EmbeddedPersistenceRecord(
+            document_id=document_id,
+            indexed_chunk_count=indexed_chunk_count,
+            signature=signature,
+            persisted_at=datetime.now(UTC),
+        )
         with self._lock:
-            record = EmbeddedPersistenceRecord(
-                document_id=document_id,
-                indexed_chunk_count=indexed_chunk_count,
-                signature=signature,
-                persisted_at=datetime.now(UTC),
-            )
             self._embedded_persistence[document_id] = record
-            return record
+        return record
 
     def get_embedded_persistence(self, document_id: str) -> EmbeddedPersistenceRecord | None:
-        with self._lock:
-            return self._embedded_persistence.get(document_id)
+        return self._embedded_persistence.get(document_id)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import math
 import re
 import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 
 from synextra.repositories.rag_document_repository import ChunkRecord
 from synextra.retrieval.types import EvidenceChunk
@@ -18,7 +21,29 @@ def _tokenize(text: str) -> list[str]:
 @dataclass(frozen=True)
 class _Bm25Corpus:
     tokenized_docs: list[list[str]]
-    chunk_records: list[ChunkRecord]
+    chunk_records: tuple[ChunkRecord, ...]
+
+
+def _top_k_from_array(scores: Any, k: int) -> list[tuple[int, float]]:
+    """Select the ``k`` best entries of a NumPy score array, best first.
+
+    Only the selected entries are sorted; ties keep corpus order, matching a
+    full ``(-score, index)`` sort.
+    """
+
+    import numpy as np
+
+    n = len(scores)
+    if k < n:
+        kth = scores[np.argpartition(scores, n - k)[n - k]]
+        above = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[: k - len(above)]
+        candidates = np.concatenate((above, tied))
+    else:
+        candidates = np.arange(n)
+    selected = [(int(idx), float(scores[idx])) for idx in candidates]
+    selected.sort(key=lambda pair: (-pair[1], pair[0]))
+    return selected
 
 
 class _Bm25Scorer:
@@ -69,6 +94,19 @@ class _Bm25Scorer:
         self._doc_len = doc_len
         self._avg_dl = sum(doc_len) / n_docs
 
+    def top_k(self, query: str, k: int) -> list[tuple[int, float]]:
+        """Return the ``k`` best ``(corpus index, score)`` pairs, best first."""
+        if self._rank_bm25 is not None:
+            query_tokens = _tokenize(query)
+            if query_tokens:
+                # Select on the score array directly instead of converting every
+                # score to a Python float and sorting the whole corpus.
+                return _top_k_from_array(self._rank_bm25.get_scores(query_tokens), k)
+
+        return heapq.nsmallest(
+            k, enumerate(self.score(query)), key=lambda pair: (-pair[1], pair[0])
+        )
+
     def score(self, query: str) -> list[float]:
         query_tokens = _tokenize(query)
         if not query_tokens:
@@ -103,20 +141,17 @@ class _Bm25Scorer:
 
 
 class Bm25Index:
-    def __init__(self, *, document_id: str, chunks: list[ChunkRecord], signature: str) -> None:
+    def __init__(self, *, document_id: str, chunks: Sequence[ChunkRecord], signature: str) -> None:
         self.document_id = document_id
         self.signature = signature
-        self._chunk_records = list(chunks)
+        self._chunk_records = tuple(chunks)
         tokenized_docs = [_tokenize(chunk.text) for chunk in chunks]
         self._corpus = _Bm25Corpus(tokenized_docs=tokenized_docs, chunk_records=self._chunk_records)
         self._scorer = _Bm25Scorer(self._corpus)
 
     def search(self, *, query: str, top_k: int = 6) -> list[EvidenceChunk]:
-        scores = self._scorer.score(query)
-        indexed = list(enumerate(scores))
-        indexed.sort(key=lambda pair: (-pair[1], pair[0]))
         evidence: list[EvidenceChunk] = []
-        for idx, score in indexed[: max(1, top_k)]:
+        for idx, score in self._scorer.top_k(query, max(1, top_k)):
             chunk = self._chunk_records[idx]
             if score <= 0:
                 continue
@@ -139,8 +174,9 @@ class Bm25IndexStore:
     def __init__(self) -> None:
         self._lock = threading.RLock()
         self._indexes: dict[str, Bm25Index] = {}
+        self._generation = 0
 
-    def upsert(self, *, document_id: str, chunks: list[ChunkRecord], signature: str) -> None:
+    def upsert(self, *, document_id: str, chunks: Sequence[ChunkRecord], signature: str) -> None:
         with self._lock:
             existing = self._indexes.get(document_id)
             if existing and existing.signature == signature:
@@ -150,6 +186,12 @@ class Bm25IndexStore:
                 chunks=chunks,
                 signature=signature,
             )
+            self._generation += 1
+
+    def generation(self) -> int:
+        """Return a counter that changes whenever an index is added or replaced."""
+        with self._lock:
+            return self._generation
 
     def search(
         self,
@@ -167,8 +209,10 @@ class Bm25IndexStore:
                     continue
                 evidence.extend(index.search(query=query, top_k=top_k))
 
-        evidence.sort(key=lambda chunk: (-chunk.score, chunk.chunk_id))
-        return evidence[: max(1, top_k)]
+        # Each index already returned at most top_k chunks; merge without a full sort.
+        return heapq.nsmallest(
+            max(1, top_k), evidence, key=lambda chunk: (-chunk.score, chunk.chunk_id)
+        )
 
     def has_document(self, document_id: str) -> bool:
         with self._lock:
@@ -15,6 +15,7 @@ PipelineNodeType = Literal[
     "agent",
     "output",
 ]
+_FILE_NODE_TYPES: frozenset[str] = frozenset({"input", "ingest"})
 
 
 class PipelineDocumentRef(BaseModel):
@@ -220,6 +221,10 @@ class PipelineRunSpec(BaseModel):
     query: str = Field(..., min_length=1)
     session_id: str | None = None
 
+    def file_node_ids(self) -> list[str]:
+        """Return ids of nodes that can consume an uploaded file (input and ingest)."""
+        return [node.id for node in self.nodes if node.type in _FILE_NODE_TYPES]
+
 
 class PipelineBm25SearchRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -144,6 +144,104 @@ def _split_oversized_block(
     return segments
 
 
+def chunk_pdf_page_blocks(
+    *,
+    document_id: str,
+    page_number: int,
+    blocks: list[PdfTextBlock],
+    start_index: int = 0,
+    token_target: int = 700,
+    overlap_tokens: int = 120,
+    preview_char_limit: int = 240,
+    tokenizer: _Tokenizer | None = None,
+) -> list[ChunkedText]:
+    """Chunk the blocks of a single PDF page.
+
+    ``start_index`` is the document-wide index of the first chunk produced, so
+    pages can be chunked one at a time while keeping chunk ids identical to
+    :func:`chunk_pdf_blocks`. ``blocks`` is sorted in place into reading order.
+    """
+
+    tokenizer = tokenizer or _Tokenizer()
+    chunks: list[ChunkedText] = []
+    chunk_index = start_index
+
+    # Sort by vertical position then horizontal position then block number.
+    blocks.sort(key=lambda b: (b.bounding_box[1], b.bounding_box[0], b.block_no))
+
+    segments: list[_BlockSegment] = []
+    for block in blocks:
+        segments.extend(
+            _split_oversized_block(block, tokenizer=tokenizer, token_target=token_target)
+        )
+
+    current_segments: list[_BlockSegment] = []
+    current_tokens = 0
+
+    def finalize_current() -> None:
+        nonlocal chunk_index, current_segments, current_tokens
+        if not current_segments:
+            return
+
+        text = "\n".join(seg.text for seg in current_segments).strip()
+        if not text:
+            current_segments = []
+            current_tokens = 0
+            return
+
+        start_block = min(seg.block_no for seg in current_segments)
+        end_block = max(seg.block_no for seg in current_segments)
+        citation_span = f"p{page_number}:b{start_block}-{end_block}"
+        bbox = _union_bbox([seg.bounding_box for seg in current_segments])
+        preview_text = text[:preview_char_limit].rstrip()
+        if len(text) > preview_char_limit:
+            preview_text = preview_text + "…"
+
+        chunk_id = _sha256_hex(f"{document_id}:{page_number}:{chunk_index}:{text}")
+
+        chunks.append(
+            ChunkedText(
+                chunk_id=chunk_id,
+                page_number=page_number,
+                chunk_index=chunk_index,
+                token_count=current_tokens,
+                citation_span=citation_span,
+                preview_text=preview_text,
+                bounding_box=bbox,
+                text=text,
+            )
+        )
+        chunk_index += 1
+
+        # Build overlap for next chunk.
+        overlap: list[_BlockSegment] = []
+        overlap_token_count = 0
+        for seg in reversed(current_segments):
+            overlap.insert(0, seg)
+            overlap_token_count += seg.token_count
+            if overlap_token_count >= overlap_tokens:
+                break
+
+        current_segments = overlap
+        current_tokens = sum(seg.token_count for seg in current_segments)
+
+    for seg in segments:
+        if current_segments and current_tokens + seg.token_count > token_target:
+            finalize_current()
+
+        # If overlap alone leaves insufficient room for the next segment,
+        # drop the overlap to keep chunks within token_target.
+        if current_segments and current_tokens + seg.token_count > token_target:
+            current_segments = []
+            current_tokens = 0
+
+        current_segments.append(seg)
+        current_tokens += seg.token_count
+
+    finalize_current()
+    return chunks
+
+
 def chunk_pdf_blocks(
     *,
     document_id: str,
@@ -176,95 +274,21 @@ def chunk_pdf_blocks(
         blocks_by_page.setdefault(block.page_number, []).append(block)
 
     chunks: list[ChunkedText] = []
-    chunk_index = 0
-
+    # Overlap is never carried across pages.
     for page_number in sorted(blocks_by_page.keys()):
-        current_page_number = page_number
-        page_blocks = blocks_by_page[page_number]
-        # Sort by vertical position then horizontal position then block number.
-        page_blocks.sort(
-            key=lambda b: (
-                float(b.bounding_box[1]),
-                float(b.bounding_box[0]),
-                int(b.block_no),
+        chunks.extend(
+            chunk_pdf_page_blocks(
+                document_id=document_id,
+                page_number=page_number,
+                blocks=blocks_by_page[page_number],
+                start_index=len(chunks),
+                token_target=token_target,
+                overlap_tokens=overlap_tokens,
+                preview_char_limit=preview_char_limit,
+                tokenizer=tokenizer,
             )
         )
 
-        segments: list[_BlockSegment] = []
-        for block in page_blocks:
-            segments.extend(
-                _split_oversized_block(block, tokenizer=tokenizer, token_target=token_target)
-            )
-
-        current_segments: list[_BlockSegment] = []
-        current_tokens = 0
-
-        def finalize_current(page_number: int) -> None:
-            nonlocal chunk_index, current_segments, current_tokens
-            if not current_segments:
-                return
-
-            text = "\n".join(seg.text for seg in current_segments).strip()
-            if not text:
-                current_segments = []
-                current_tokens = 0
-                return
-
-            start_block = min(seg.block_no for seg in current_segments)
-            end_block = max(seg.block_no for seg in current_segments)
-            citation_span = f"p{page_number}:b{start_block}-{end_block}"
-            bbox = _union_bbox([seg.bounding_box for seg in current_segments])
-            preview_text = text[:preview_char_limit].rstrip()
-            if len(text) > preview_char_limit:
-                preview_text = preview_text + "…"
-
-            chunk_id = _sha256_hex(f"{document_id}:{page_number}:{chunk_index}:{text}")
-
-            chunks.append(
-                ChunkedText(
-                    chunk_id=chunk_id,
-                    page_number=page_number,
-                    chunk_index=chunk_index,
-                    token_count=current_tokens,
-                    citation_span=citation_span,
-                    preview_text=preview_text,
-                    bounding_box=bbox,
-                    text=text,
-                )
-            )
-            chunk_index += 1
-
-            # Build overlap for next chunk.
-            overlap: list[_BlockSegment] = []
-            overlap_token_count = 0
-            for seg in reversed(current_segments):
-                overlap.insert(0, seg)
-                overlap_token_count += seg.token_count
-                if overlap_token_count >= overlap_tokens:
-                    break
-
-            current_segments = overlap
-            current_tokens = sum(seg.token_count for seg in current_segments)
-
-        for seg in segments:
-            if current_segments and current_tokens + seg.token_count > token_target:
-                finalize_current(current_page_number)
-
-            # If overlap alone leaves insufficient room for the next segment,
-            # drop the overlap to keep chunks within token_target.
-            if current_segments and current_tokens + seg.token_count > token_target:
-                current_segments = []
-                current_tokens = 0
-
-            current_segments.append(seg)
-            current_tokens += seg.token_count
-
-        finalize_current(current_page_number)
-
-        # Avoid carrying overlap across pages.
-        current_segments = []
-        current_tokens = 0
-
     return chunks
 
 
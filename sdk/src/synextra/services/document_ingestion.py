@@ -12,12 +12,16 @@ from typing import Literal
 
 from docx import Document
 
-from synextra.services.block_chunker import ChunkedText, chunk_pdf_blocks, chunk_text_pages
-from synextra.services.document_store import PageText, build_page_texts_from_blocks
+from synextra.services.block_chunker import (
+    ChunkedText,
+    chunk_pdf_page_blocks,
+    chunk_text_pages,
+)
+from synextra.services.document_store import PageText, build_page_text_from_blocks
 from synextra.services.pdf_ingestion import (
     PdfEncryptedError,
     PdfIngestionError,
-    extract_pdf_blocks,
+    iter_pdf_page_blocks,
     sha256_hex,
 )
 
@@ -409,29 +413,46 @@ def parse_document(
     content_type: str | None,
     document_id: str | None = None,
     lines_per_page: int = 160,
+    checksum_sha256: str | None = None,
 ) -> ParsedDocument:
-    """Parse + chunk a supported document into pages and retrieval chunks."""
+    """Parse + chunk a supported document into pages and retrieval chunks.
+
+    Callers that already hashed ``data`` can pass ``checksum_sha256`` so the
+    payload is hashed once per ingest.
+    """
 
-    resolved_id = document_id or sha256_hex(data)
-    checksum = sha256_hex(data)
+    checksum = checksum_sha256 or sha256_hex(data)
+    resolved_id = document_id or checksum
 
     kind, mime = detect_document_kind(data=data, filename=filename, content_type=content_type)
 
     if kind == "pdf":
+        # Pages are extracted, rendered and chunked one at a time so only a
+        # single page's blocks are alive at once. PyMuPDF's own sort is skipped:
+        # both consumers order each page by (y0, x0, block_no) themselves.
+        pages: list[PageText] = []
+        chunks: list[ChunkedText] = []
         try:
-            pdf = extract_pdf_blocks(data, sort=True)
+            for page_number, page_blocks in iter_pdf_page_blocks(data, sort=False):
+                pages.append(build_page_text_from_blocks(page_number, page_blocks))
+                chunks.extend(
+                    chunk_pdf_page_blocks(
+                        document_id=resolved_id,
+                        page_number=page_number,
+                        blocks=page_blocks,
+                        start_index=len(chunks),
+                    )
+                )
         except PdfEncryptedError:
             raise
         except PdfIngestionError as exc:
             raise DocumentParseError("Failed to parse PDF") from exc
 
-        chunks = chunk_pdf_blocks(document_id=resolved_id, blocks=pdf.blocks)
-        pages = build_page_texts_from_blocks(pdf.blocks, pdf.page_count)
         return ParsedDocument(
             kind=kind,
             mime_type=mime,
-            checksum_sha256=pdf.checksum_sha256,
-            page_count=pdf.page_count,
+            checksum_sha256=checksum,
+            page_count=len(pages),
             pages=pages,
             chunks=chunks,
         )
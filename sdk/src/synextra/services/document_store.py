@@ -23,6 +23,16 @@ class DocumentInfo:
     page_count: int
 
 
+def _drop_trailing_blank_lines(lines: list[str]) -> None:
+    """Remove trailing empty or whitespace-only lines in place."""
+
+    end = len(lines)
+    # ``isspace`` checks without allocating the stripped copy ``strip`` would.
+    while end and (not lines[end - 1] or lines[end - 1].isspace()):
+        end -= 1
+    del lines[end:]
+
+
 def extract_page_texts(pdf_bytes: bytes) -> list[PageText]:
     """Extract per-page text from a PDF, split into lines.
 
@@ -41,9 +51,7 @@ def extract_page_texts(pdf_bytes: bytes) -> list[PageText]:
             raw = page.get_text("text", sort=True)
             lines = raw.splitlines()
 
-            # Strip trailing empty lines.
-            while lines and not lines[-1].strip():
-                lines.pop()
+            _drop_trailing_blank_lines(lines)
 
             pages.append(
                 PageText(
@@ -70,31 +78,25 @@ def build_page_texts_from_blocks(
     for block in blocks:
         blocks_by_page.setdefault(block.page_number, []).append(block)
 
-    pages: list[PageText] = []
-    for page_number in range(page_count):
-        page_blocks = blocks_by_page.get(page_number, [])
-        page_blocks.sort(
-            key=lambda b: (
-                float(b.bounding_box[1]),
-                float(b.bounding_box[0]),
-                int(b.block_no),
-            )
-        )
-        raw = "\n".join(b.text for b in page_blocks)
-        lines = raw.splitlines()
-
-        while lines and not lines[-1].strip():
-            lines.pop()
-
-        pages.append(
-            PageText(
-                page_number=page_number,
-                lines=lines,
-                line_count=len(lines),
-            )
-        )
+    return [
+        build_page_text_from_blocks(page_number, blocks_by_page.get(page_number, []))
+        for page_number in range(page_count)
+    ]
 
-    return pages
+
+def build_page_text_from_blocks(page_number: int, page_blocks: list[PdfTextBlock]) -> PageText:
+    """Build the text of one page from its blocks (sorted in place into reading order)."""
+
+    page_blocks.sort(key=lambda b: (b.bounding_box[1], b.bounding_box[0], b.block_no))
+    raw = "\n".join(b.text for b in page_blocks)
+    lines = raw.splitlines()
+    _drop_trailing_blank_lines(lines)
+
+    return PageText(
+        page_number=page_number,
+        lines=lines,
+        line_count=len(lines),
+    )
 
 
 def _format_numbered_lines(lines: list[str], start: int = 1) -> str:
@@ -116,8 +118,12 @@ class DocumentStore:
 
     def __init__(self) -> None:
         self._lock = threading.RLock()
-        self._pages: dict[str, list[PageText]] = {}
+        # Pages are keyed by page number so read_page is a dict lookup.
+        self._pages: dict[str, dict[int, PageText]] = {}
+        # Formatted whole-page reads, filled on first read of each page.
+        self._page_reads: dict[str, dict[int, str]] = {}
         self._info: dict[str, DocumentInfo] = {}
+        self._generation = 0
 
     def store_pages(
         self,
@@ -127,12 +133,19 @@ class DocumentStore:
         pages: list[PageText],
     ) -> None:
         with self._lock:
-            self._pages[document_id] = list(pages)
+            self._pages[document_id] = {page.page_number: page for page in pages}
+            self._page_reads.pop(document_id, None)
             self._info[document_id] = DocumentInfo(
                 document_id=document_id,
                 filename=filename,
                 page_count=len(pages),
             )
+            self._generation += 1
+
+    def generation(self) -> int:
+        """Return a counter that changes whenever a document's pages are stored."""
+        with self._lock:
+            return self._generation
 
     def has_document(self, document_id: str) -> bool:
         with self._lock:
@@ -171,33 +184,42 @@ class DocumentStore:
         Returns ``None`` when the document or page does not exist.
         """
 
+        # Stored pages are never mutated, so only the lookup needs the lock;
+        # formatting runs outside it.
+        whole_page = start_line is None and end_line is None
         with self._lock:
             pages = self._pages.get(document_id)
-            if pages is None:
-                return None
-
-            page = next((p for p in pages if p.page_number == page_number), None)
-            if page is None:
-                return None
-
-            lines = page.lines
-            total = page.line_count
-
-            actual_start = max(1, start_line) if start_line is not None else 1
-            actual_end = min(total, end_line) if end_line is not None else total
-
-            if actual_start > total:
-                return (
-                    f"Page {page_number} has {total} lines. "
-                    f"Requested start_line {actual_start} is out of range."
-                )
-
-            selected = lines[actual_start - 1 : actual_end]
-            header = f"Page {page_number}"
-            if start_line is not None or end_line is not None:
-                header += f" (lines {actual_start}-{actual_end} of {total})"
-            else:
-                header += f" ({total} lines)"
+            page = pages.get(page_number) if pages is not None else None
+            cached = self._page_reads.get(document_id, {}).get(page_number) if whole_page else None
+        if page is None:
+            return None
+        if cached is not None:
+            return cached
+
+        lines = page.lines
+        total = page.line_count
+
+        actual_start = max(1, start_line) if start_line is not None else 1
+        actual_end = min(total, end_line) if end_line is not None else total
+
+        if actual_start > total:
+            return (
+                f"Page {page_number} has {total} lines. "
+                f"Requested start_line {actual_start} is out of range."
+            )
 
-            body = _format_numbered_lines(selected, start=actual_start)
-            return f"{header}:\n{body}"
+        selected = lines[actual_start - 1 : actual_end]
+        header = f"Page {page_number}"
+        if start_line is not None or end_line is not None:
+            header += f" (lines {actual_start}-{actual_end} of {total})"
+        else:
+            header += f" ({total} lines)"
+
+        body = _format_numbered_lines(selected, start=actual_start)
+        result = f"{header}:\n{body}"
+        if whole_page:
+            with self._lock:
+                # Skip caching if the document was replaced while formatting.
+                if self._pages.get(document_id) is pages:
+                    self._page_reads.setdefault(document_id, {})[page_number] = result
+        return result
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from itertools import repeat
+from typing import Any, Literal
 
 import pymupdf
 
@@ -30,6 +35,19 @@ class PdfIngestionResult:
     blocks: list[PdfTextBlock]
 
 
+@dataclass(frozen=True)
+class PdfStrategy:
+    name: Literal["inline", "process"]
+    pages_per_task: int
+    workers: int
+
+
+# Extraction moves to worker processes only for large documents.
+_PROCESS_STRATEGY_MIN_PAGES = 500
+_MAX_PAGES_PER_TASK = 500
+_MAX_PROCESS_WORKERS = 4
+
+
 def sha256_hex(payload: bytes) -> str:
     return hashlib.sha256(payload).hexdigest()
 
@@ -40,7 +58,117 @@ def _open_pdf(pdf_bytes: bytes) -> Any:
     return pymupdf_module.open(stream=pdf_bytes, filetype="pdf")
 
 
-def extract_pdf_blocks(pdf_bytes: bytes, *, sort: bool = True) -> PdfIngestionResult:
+def choose_pdf_strategy(page_count: int) -> PdfStrategy:
+    """Pick how to extract a PDF of ``page_count`` pages.
+
+    Documents up to ``_PROCESS_STRATEGY_MIN_PAGES`` pages are read page by page
+    in the calling thread; the fixed cost of starting worker processes only pays
+    off beyond that, where page ranges are extracted in parallel.
+    """
+
+    workers = min(os.cpu_count() or 1, _MAX_PROCESS_WORKERS)
+    if page_count <= _PROCESS_STRATEGY_MIN_PAGES or workers < 2:
+        return PdfStrategy(name="inline", pages_per_task=max(page_count, 1), workers=1)
+
+    pages_per_task = min(_MAX_PAGES_PER_TASK, -(-page_count // workers))
+    return PdfStrategy(name="process", pages_per_task=pages_per_task, workers=workers)
+
+
+def _ensure_not_encrypted(doc: Any) -> None:
+    # Both flags are present across PyMuPDF versions.
+    if getattr(doc, "is_encrypted", False) or getattr(doc, "needs_pass", False):
+        raise PdfEncryptedError("PDF is encrypted or requires a password")
+
+
+def _page_text_blocks(page: Any, *, sort: bool) -> tuple[int, list[PdfTextBlock]]:
+    page_number = int(getattr(page, "number", 0))
+    blocks: list[PdfTextBlock] = []
+    for x0, y0, x1, y1, text, block_no, block_type in page.get_text("blocks", sort=sort):
+        # Text blocks use type 0.
+        if block_type != 0:
+            continue
+
+        cleaned = " ".join(text.split())
+        if not cleaned:
+            continue
+
+        blocks.append(
+            PdfTextBlock(
+                page_number=page_number,
+                block_no=int(block_no),
+                bounding_box=[float(x0), float(y0), float(x1), float(y1)],
+                text=cleaned,
+            )
+        )
+    return page_number, blocks
+
+
+def _extract_page_range(
+    pdf_bytes: bytes, start: int, stop: int, sort: bool
+) -> list[tuple[int, list[PdfTextBlock]]]:
+    # Runs in a worker process, which opens its own copy of the document.
+    with _open_pdf(pdf_bytes) as doc:
+        return [_page_text_blocks(doc[index], sort=sort) for index in range(start, stop)]
+
+
+def map_page_ranges[S, T](
+    worker: Callable[[S, int, int, bool], list[T]],
+    source: S,
+    *,
+    page_count: int,
+    strategy: PdfStrategy,
+    sort: bool,
+) -> Iterator[T]:
+    """Run ``worker`` over the page ranges of ``strategy`` in worker processes.
+
+    ``worker(source, start, stop, sort)`` must be a module-level function that
+    opens its own copy of the document from ``source`` and returns one result per
+    page in ``range(start, stop)``. Results are yielded in page order.
+    """
+
+    starts = range(0, page_count, strategy.pages_per_task)
+    stops = [min(start + strategy.pages_per_task, page_count) for start in starts]
+    # Spawned workers avoid forking a process that is running server threads.
+    with ProcessPoolExecutor(
+        max_workers=strategy.workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        for page_range in pool.map(worker, repeat(source), starts, stops, repeat(sort)):
+            yield from page_range
+
+
+def iter_pdf_page_blocks(
+    pdf_bytes: bytes, *, sort: bool = True, strategy: PdfStrategy | None = None
+) -> Iterator[tuple[int, list[PdfTextBlock]]]:
+    """Yield ``(page_number, blocks)`` for each page of a PDF, in page order.
+
+    Every page is yielded, including pages without text, so callers can count
+    pages and build per-page state without holding the whole document's blocks.
+    The extraction strategy is chosen from the page count unless ``strategy``
+    is given.
+    """
+
+    try:
+        with _open_pdf(pdf_bytes) as doc:
+            _ensure_not_encrypted(doc)
+            page_count = int(doc.page_count)
+            strategy = strategy or choose_pdf_strategy(page_count)
+            if strategy.name == "inline":
+                for page in doc:
+                    yield _page_text_blocks(page, sort=sort)
+                return
+
+        yield from map_page_ranges(
+            _extract_page_range, pdf_bytes, page_count=page_count, strategy=strategy, sort=sort
+        )
+    except PdfIngestionError:
+        raise
+    except Exception as exc:  # pragma: no cover
+        raise PdfIngestionError("Failed to parse PDF") from exc
+
+
+def extract_pdf_blocks(
+    pdf_bytes: bytes, *, sort: bool = True, checksum_sha256: str | None = None
+) -> PdfIngestionResult:
     """Extract text blocks from a PDF.
 
     The block geometry is preserved to support downstream citations.
@@ -50,45 +178,19 @@ def extract_pdf_blocks(pdf_bytes: bytes, *, sort: bool = True) -> PdfIngestionRe
     * Pages are 0-based.
     * Blocks are sorted using PyMuPDF's ordering when ``sort=True``.
     * Non-text blocks are ignored.
+    * ``checksum_sha256`` skips re-hashing when the caller already has it.
     """
 
-    checksum = sha256_hex(pdf_bytes)
+    checksum = checksum_sha256 or sha256_hex(pdf_bytes)
 
-    try:
-        with _open_pdf(pdf_bytes) as doc:
-            # Both flags are present across PyMuPDF versions.
-            if getattr(doc, "is_encrypted", False) or getattr(doc, "needs_pass", False):
-                raise PdfEncryptedError("PDF is encrypted or requires a password")
-
-            blocks: list[PdfTextBlock] = []
-            for page in doc:
-                page_number = int(getattr(page, "number", 0))
-                for x0, y0, x1, y1, text, block_no, block_type in page.get_text(
-                    "blocks", sort=sort
-                ):
-                    # Text blocks use type 0.
-                    if block_type != 0:
-                        continue
-
-                    cleaned = " ".join(str(text).split())
-                    if not cleaned:
-                        continue
-
-                    blocks.append(
-                        PdfTextBlock(
-                            page_number=page_number,
-                            block_no=int(block_no),
-                            bounding_box=[float(x0), float(y0), float(x1), float(y1)],
-                            text=cleaned,
-                        )
-                    )
-
-            return PdfIngestionResult(
-                page_count=int(getattr(doc, "page_count", len(doc))),
-                checksum_sha256=checksum,
-                blocks=blocks,
-            )
-    except PdfIngestionError:
-        raise
-    except Exception as exc:  # pragma: no cover
-        raise PdfIngestionError("Failed to parse PDF") from exc
+    blocks: list[PdfTextBlock] = []
+    page_count = 0
+    for _page_number, page_blocks in iter_pdf_page_blocks(pdf_bytes, sort=sort):
+        blocks.extend(page_blocks)
+        page_count += 1
+
+    return PdfIngestionResult(
+        page_count=page_count,
+        checksum_sha256=checksum,
+        blocks=blocks,
+    )
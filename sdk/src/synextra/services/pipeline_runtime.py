@@ -5,10 +5,10 @@ import os
 import re
 import threading
 from collections import defaultdict, deque
-from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Mapping, Sequence
 from datetime import UTC, datetime
-from typing import Any, TypeVar, cast
-from uuid import uuid4
+from secrets import token_hex
+from typing import Any, BinaryIO, TypeVar, cast
 
 from agents import Agent, Runner
 from agents.model_settings import ModelSettings
@@ -114,6 +114,15 @@ def _extract_summary_points(
     return points
 
 
+def _read_upload(payload: bytes | BinaryIO) -> bytes:
+    """Return upload bytes, reading file-like payloads from the start."""
+
+    if isinstance(payload, bytes):
+        return payload
+    payload.seek(0)
+    return payload.read()
+
+
 def _render_template(template: str, *, query: str) -> str:
     if "{query}" not in template:
         return template.strip() or query
@@ -549,12 +558,12 @@ class PipelineRuntime:
         self,
         *,
         spec: PipelineRunSpec,
-        files_by_node: dict[str, tuple[str, str | None, bytes]],
+        files_by_node: Mapping[str, tuple[str, str | None, bytes | BinaryIO]],
         run_id: str | None = None,
         pause_event: asyncio.Event | None = None,
     ) -> AsyncIterator[PipelineRunEvent]:
         if run_id is None:
-            run_id = uuid4().hex
+            run_id = token_hex(16)
         timestamp = _now_iso()
         yield PipelineRunStartedEvent(run_id=run_id, timestamp=timestamp)
 
@@ -649,7 +658,7 @@ class PipelineRuntime:
         query: str,
         incoming_sources: list[str],
         outputs: dict[str, dict[str, Any]],
-        files_by_node: dict[str, tuple[str, str | None, bytes]],
+        files_by_node: Mapping[str, tuple[str, str | None, bytes | BinaryIO]],
     ) -> dict[str, Any]:
         upstream = [outputs[source_id] for source_id in incoming_sources if source_id in outputs]
 
@@ -659,7 +668,7 @@ class PipelineRuntime:
             if file_info is not None:
                 filename, content_type, payload = file_info
                 ingest = self._synextra.ingest(
-                    payload, filename=filename, content_type=content_type
+                    _read_upload(payload), filename=filename, content_type=content_type
                 )
                 doc = PipelineDocumentRef(
                     document_id=ingest.document_id,
@@ -676,7 +685,9 @@ class PipelineRuntime:
             if file_info is None:
                 raise ValueError(f"Missing uploaded file for ingest node {node.id}")
             filename, content_type, payload = file_info
-            ingest = self._synextra.ingest(payload, filename=filename, content_type=content_type)
+            ingest = self._synextra.ingest(
+                _read_upload(payload), filename=filename, content_type=content_type
+            )
             doc = PipelineDocumentRef(
                 document_id=ingest.document_id,
                 filename=ingest.filename,
@@ -813,7 +824,9 @@ class PipelineRuntime:
 
     @staticmethod
     def _from_evidence_chunk(chunk: EvidenceChunk) -> PipelineEvidenceChunk:
-        return PipelineEvidenceChunk(
+        # Retrieval output is already typed, so the schema is built without
+        # re-running field validation; the same holds for citations below.
+        return PipelineEvidenceChunk.model_construct(
             document_id=chunk.document_id,
             chunk_id=chunk.chunk_id,
             page_number=chunk.page_number,
@@ -918,7 +931,7 @@ class PipelineRuntime:
             if not quote:
                 continue
             citations.append(
-                PipelineCitation(
+                PipelineCitation.model_construct(
                     document_id=chunk.document_id,
                     chunk_id=chunk.chunk_id,
                     page_number=chunk.page_number,
@@ -957,7 +970,7 @@ class PipelineRuntime:
                 scored_chunks.append(
                     (
                         overlap,
-                        PipelineEvidenceChunk(
+                        PipelineEvidenceChunk.model_construct(
                             document_id=chunk.document_id,
                             chunk_id=chunk.chunk_id,
                             page_number=chunk.page_number,
@@ -4,8 +4,11 @@ import asyncio
 import json
 import os
 import re
-from collections.abc import AsyncIterator, Awaitable, Callable
-from dataclasses import asdict, dataclass
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
 
@@ -32,7 +35,7 @@ from synextra.services.document_store import DocumentStore
 from synextra.services.session_memory import SessionMemory
 
 _SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
-_STREAM_CHUNK_RE = re.compile(r"\S+\s*")
+_STREAM_CHUNK_CHARS = 4096
 
 _DEFAULT_CHAT_MODEL = "gpt-5.2"
 
@@ -40,6 +43,13 @@ _MAX_JUDGE_ITERATIONS = 3
 
 _FALLBACK_ANSWER = "I could not find reliable information to answer your question."
 
+_RETRIEVAL_CACHE_SIZE = 1024
+_RETRIEVAL_CACHE_TTL_SECONDS = 300.0
+# Results carrying any of these markers are degraded and are retried next time.
+_UNCACHEABLE_TOOL_MARKERS = frozenset(
+    {"agent_retrieval_failed", "bm25_search_fallback", "citation_validation_failed"}
+)
+
 
 class Bm25ParallelQuery(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -68,14 +78,14 @@ def _now_iso() -> str:
 
 
 def _normalize_inline_whitespace(text: str) -> str:
-    return " ".join(text.split()).strip()
+    # split() already drops leading and trailing whitespace, so no strip() is needed.
+    return " ".join(text.split())
 
 
-def _quote_fingerprint(text: str, *, prefix_len: int = 160) -> str:
-    normalized = _normalize_inline_whitespace(text).lower()
-    if len(normalized) <= prefix_len:
-        return normalized
-    return normalized[:prefix_len]
+def _quote_fingerprint(quote: str, *, prefix_len: int = 160) -> str:
+    # ``quote`` comes from _truncate_quote and is already whitespace-normalised;
+    # slicing first keeps lower() to the prefix.
+    return quote[:prefix_len].lower()
 
 
 def _truncate_quote(text: str, limit: int = 240) -> str:
@@ -85,10 +95,26 @@ def _truncate_quote(text: str, limit: int = 240) -> str:
     return cleaned[:limit].rstrip() + "\u2026"
 
 
+def _evidence_payload(chunk: EvidenceChunk) -> dict[str, Any]:
+    # EvidenceChunk holds only primitives, so its attribute dict serialises the
+    # same as ``asdict`` without the recursive deep copy.
+    return vars(chunk)
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Lazily yield the pieces ``_SENTENCE_RE.split(text)`` would return."""
+    start = 0
+    for match in _SENTENCE_RE.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    yield text[start:]
+
+
 def _simple_summary(evidence: list[EvidenceChunk], *, max_sentences: int = 4) -> str:
     sentences: list[str] = []
     for chunk in evidence:
-        for sentence in _SENTENCE_RE.split(chunk.text):
+        # Lazy splitting stops scanning a chunk once enough sentences are found.
+        for sentence in _iter_sentences(chunk.text):
             sentence = _normalize_inline_whitespace(sentence)
             if not sentence:
                 continue
@@ -107,10 +133,12 @@ def _simple_summary(evidence: list[EvidenceChunk], *, max_sentences: int = 4) ->
 
 
 def _stream_chunks(text: str) -> list[str]:
-    chunks = _STREAM_CHUNK_RE.findall(text)
-    if chunks:
-        return chunks
-    return [text] if text else []
+    # The answer is already complete here, so slice it in large fixed steps
+    # instead of one chunk per word; the transport does its own framing.
+    return [
+        text[start : start + _STREAM_CHUNK_CHARS]
+        for start in range(0, len(text), _STREAM_CHUNK_CHARS)
+    ]
 
 
 def _chat_model() -> str:
@@ -158,6 +186,40 @@ class JudgeVerdict:
     feedback: str
 
 
+_RetrievalCacheKey = tuple[str, str, str, bool, int, int]
+
+
+class _RetrievalCache:
+    """Thread-safe LRU of recent retrieval results with a per-entry TTL."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._lock = threading.RLock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[_RetrievalCacheKey, tuple[float, OrchestratorResult]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: _RetrievalCacheKey) -> OrchestratorResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: _RetrievalCacheKey, result: OrchestratorResult) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
 class RagAgentOrchestrator:
     """Coordinates retrieval and response synthesis for chat requests."""
 
@@ -175,6 +237,10 @@ class RagAgentOrchestrator:
         self._session_memory = session_memory
         self._document_store = document_store
         self._citation_validator = citation_validator or CitationValidator()
+        self._retrieval_cache = _RetrievalCache(
+            max_entries=_RETRIEVAL_CACHE_SIZE,
+            ttl_seconds=_RETRIEVAL_CACHE_TTL_SECONDS,
+        )
 
     async def handle_message(self, *, session_id: str, request: RagChatRequest) -> RagChatResponse:
         prompt = request.prompt.strip()
@@ -355,7 +421,7 @@ Use the tools below to extract additional evidence from the documents.
             )
             results = bm25_store.search(query=query, top_k=max(1, top_k))
             evidence_collector.extend(results)
-            return json.dumps([asdict(r) for r in results])
+            return json.dumps([_evidence_payload(r) for r in results])
 
         @function_tool(name_override="read_document")
         async def read_document(
@@ -423,7 +489,7 @@ Use the tools below to extract additional evidence from the documents.
                 source_tool="read_document",
             )
             evidence_collector.append(chunk)
-            return json.dumps(asdict(chunk))
+            return json.dumps(_evidence_payload(chunk))
 
         @function_tool(name_override="parallel_search")
         async def parallel_search(queries: list[ParallelQuery] | str) -> str:
@@ -485,7 +551,7 @@ Use the tools below to extract additional evidence from the documents.
                     )
                     results = bm25_store.search(query=query_str, top_k=max(1, top_k_val))
                     evidence_collector.extend(results)
-                    return [asdict(r) for r in results]
+                    return [_evidence_payload(r) for r in results]
                 if item_type == "read_document":
                     page_val = int(item.get("page", 0))
                     start_line_val: int | None = item.get("start_line")
@@ -543,7 +609,7 @@ Use the tools below to extract additional evidence from the documents.
                         source_tool="read_document",
                     )
                     evidence_collector.append(chunk)
-                    return asdict(chunk)
+                    return _evidence_payload(chunk)
                 return {
                     "error": (
                         f"Unknown query type: {item_type!r}. Use 'bm25_search' or 'read_document'."
@@ -564,20 +630,42 @@ Use the tools below to extract additional evidence from the documents.
         event_collector: list[StreamEvent] | None = None,
         event_sink: EventSink | None = None,
     ) -> OrchestratorResult:
-        """Run retrieval once or with judge review, based on review_enabled."""
+        """Run retrieval once or with judge review, based on review_enabled.
+
+        Results are reused for repeats of the same prompt, model and settings while
+        the indexed corpus is unchanged. A cache hit emits no search events.
+        """
+        cache_key: _RetrievalCacheKey = (
+            " ".join(prompt.split()),
+            _chat_model(),
+            reasoning_effort,
+            review_enabled,
+            self._bm25_store.generation(),
+            self._document_store.generation(),
+        )
+        cached = self._retrieval_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if review_enabled:
-            return await self._run_retrieval_with_review(
+            result = await self._run_retrieval_with_review(
                 prompt=prompt,
                 reasoning_effort=reasoning_effort,
                 event_collector=event_collector,
                 event_sink=event_sink,
             )
-        return await self._run_retrieval_once(
-            prompt=prompt,
-            reasoning_effort=reasoning_effort,
-            event_collector=event_collector,
-            event_sink=event_sink,
-        )
+        else:
+            result = await self._run_retrieval_once(
+                prompt=prompt,
+                reasoning_effort=reasoning_effort,
+                event_collector=event_collector,
+                event_sink=event_sink,
+            )
+
+        # Only clean agent-backed answers are reused.
+        if result.evidence and _UNCACHEABLE_TOOL_MARKERS.isdisjoint(result.tools_used):
+            self._retrieval_cache.put(cache_key, result)
+        return result
 
     async def _run_retrieval_once(
         self,
@@ -654,8 +742,9 @@ Use the tools below to extract additional evidence from the documents.
                 continue
             seen_quotes.add(quote_key)
 
+            # Evidence chunks are typed internal records; skip re-validation.
             citations.append(
-                RagCitation(
+                RagCitation.model_construct(
                     document_id=chunk.document_id,
                     chunk_id=chunk.chunk_id,
                     page_number=chunk.page_number,